@@ -0,0 +1,31 @@
+#!/usr/bin/env sh
+# Jalankan CodeDevour di bawah gunicorn (Linux/macOS).
+# Satu worker proses + beberapa thread: TaskManager, cache config dan cache
+# isi file tersimpan di memori proses, jadi semua request harus masuk ke
+# proses yang sama; thread tetap melayani request ringan selama extractor berjalan.
+set -e
+cd "$(dirname "$0")/.."
+
+if [ -f ".venv/bin/activate" ]; then
+    . ".venv/bin/activate"
+elif [ -f "venv/bin/activate" ]; then
+    . "venv/bin/activate"
+fi
+
+BIND="${CD_BIND:-127.0.0.1:5000}"
+THREADS="${CD_THREADS:-8}"
+
+if ! command -v gunicorn >/dev/null 2>&1; then
+    echo "gunicorn tidak ditemukan, memakai server Flask (pip install gunicorn)." >&2
+    exec python -m server.app
+fi
+
+if [ -z "${CD_NO_BROWSER}" ]; then
+    (sleep 1 && python -m webbrowser -t "http://${BIND}" >/dev/null 2>&1) &
+fi
+
+exec gunicorn server.app:app \
+    --workers 1 \
+    --threads "${THREADS}" \
+    --bind "${BIND}" \
+    --timeout 600
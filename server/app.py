@@ -7,6 +7,7 @@ from threading import Timer
 from flask import Flask
 
 from server.config import ROOT_DIR, SERVER_DIR, env_bool
+from server.json_provider import install_json_provider
 from server.routes import register_blueprints
 
 
@@ -16,6 +17,7 @@ def create_app() -> Flask:
         template_folder=str(SERVER_DIR / "templates"),
         static_folder=str(ROOT_DIR / "static"),
     )
+    install_json_provider(app)
     register_blueprints(app)
     return app
 
@@ -27,10 +29,16 @@ if __name__ == "__main__":
     def open_browser() -> None:
         webbrowser.open_new("http://127.0.0.1:5000")
 
-    if os.environ.get("WERKZEUG_RUN_MAIN") == "true" and not getattr(app, "browser_opened", False):
+    debug_mode = env_bool("FLASK_DEBUG", True)
+    # Reloader men-spawn interpreter kedua (import ulang semua modul + load config);
+    # FLASK_RELOADER=0 mematikannya tanpa harus mematikan debug
+    use_reloader = env_bool("FLASK_RELOADER", debug_mode)
+
+    # Dengan reloader, browser hanya dibuka dari proses anak (WERKZEUG_RUN_MAIN)
+    is_serving_process = not use_reloader or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    if is_serving_process and not getattr(app, "browser_opened", False):
         Timer(1, open_browser).start()
         app.browser_opened = True
 
-    debug_mode = env_bool("FLASK_DEBUG", True)
-    app.run(debug=debug_mode)
+    app.run(debug=debug_mode, use_reloader=use_reloader)
 
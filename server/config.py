@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import json
 import os
+import re
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 ROOT_DIR = Path(__file__).resolve().parent.parent
 SERVER_DIR = ROOT_DIR / "server"
 DATA_DIR = ROOT_DIR / "data"
 OUTPUT_DIR = DATA_DIR / "output"
 LISTS_DIR = ROOT_DIR / "lists"
 CONFIG_FILE_PATH = DATA_DIR / "config.json"
+EXTRACTED_LIST_FILE = OUTPUT_DIR / "OutputExtractedFiles.txt"
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "TARGET_FOLDER": "",
@@ -24,8 +34,10 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 ALLOWED_ROOTS: list[str] = []
 
 _config_cache: Dict[str, Any] | None = None
-_config_mtime: float = 0.0  # Track config file modification time
+_config_mtime_ns: int = 0  # Track config file modification time (ns, presisi penuh)
+_config_payload: bytes | None = None  # JSON terakhir yang ditulis save_config
 _lock = Lock()
+_update_lock = Lock()  # Serialisasi read-modify-write set_config_value
 
 
 def ensure_directories() -> None:
@@ -34,35 +46,37 @@ def ensure_directories() -> None:
     LISTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+_SMART_QUOTES = {("\u201c", "\u201d"), ("\u2018", "\u2019")}
+_OPENING_QUOTES = "\"'\u201c\u2018"
+# Backslash -> slash dalam satu pass translate; run slash berurutan diringkas satu sub()
+_SLASH_TABLE = str.maketrans("\\", "/")
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+
+
 def clean_path(value: str) -> str:
     if not value:
         return value
     path = value.strip()
-    smart_quotes = {("\u201c", "\u201d"), ("\u2018", "\u2019")}
+    # Fast path: path yang sudah bersih (tanpa kutip pembuka, backslash atau "//")
+    # dikembalikan langsung tanpa loop replace
+    if "\\" not in path and "//" not in path and path[:1] not in _OPENING_QUOTES:
+        return path
+
     while len(path) >= 2 and (
         (path[0] == path[-1] and path[0] in {'"', "'"})
-        or (path[0], path[-1]) in smart_quotes
+        or (path[0], path[-1]) in _SMART_QUOTES
     ):
         path = path[1:-1].strip()
 
-    path = path.replace("\\", "/")
+    path = path.translate(_SLASH_TABLE)
 
     if path.startswith("//"):
-        head, rest = "//", path[2:]
-        while "//" in rest:
-            rest = rest.replace("//", "/")
-        return head + rest
+        return "//" + _MULTI_SLASH_RE.sub("/", path[2:])
 
     if len(path) >= 3 and path[1:3] == ":/":
-        drive, rest = path[:3], path[3:]
-        while "//" in rest:
-            rest = rest.replace("//", "/")
-        return drive + rest
-
-    while "//" in path:
-        path = path.replace("//", "/")
+        return path[:3] + _MULTI_SLASH_RE.sub("/", path[3:])
 
-    return path
+    return _MULTI_SLASH_RE.sub("/", path)
 
 
 def env_bool(name: str, default: bool = False) -> bool:
@@ -72,18 +86,80 @@ def env_bool(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "y"}
 
 
+def _path_prefix(path: str) -> str:
+    """Path absolut ter-resolve + separator di akhir, untuk pencocokan prefix."""
+    return os.path.normcase(os.path.realpath(path)).rstrip(os.sep) + os.sep
+
+
+@lru_cache(maxsize=8)
+def _allowed_root_prefixes(roots: tuple[str, ...]) -> tuple[str, ...]:
+    # Di-resolve sekali per isi ALLOWED_ROOTS, bukan sekali per pemanggilan
+    return tuple(_path_prefix(root) for root in roots)
+
+
 def is_allowed_path(path: str) -> bool:
     if not ALLOWED_ROOTS:
         return True
-    target = Path(path).resolve()
-    for root in ALLOWED_ROOTS:
-        root_path = Path(root).resolve()
+    # Separator di akhir kedua sisi: `/data` cocok untuk `/data` dan `/data/x`, tetapi tidak `/database`
+    target = _path_prefix(path)
+    return any(target.startswith(root) for root in _allowed_root_prefixes(tuple(ALLOWED_ROOTS)))
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Tulis file secara atomik: isi lengkap ditulis ke file sementara unik
+    (mkstemp) di folder yang sama lalu di-os.replace, sehingga crash di tengah
+    penulisan tidak meninggalkan file setengah jadi dan dua penulis bersamaan
+    tidak saling menimpa file sementara.
+
+    Ditulis langsung lewat os.write (tanpa lapisan TextIOWrapper dan buffer);
+    loop memoryview menangani partial write tanpa menyalin data.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
         try:
-            if root_path in target.parents or target == root_path:
-                return True
-        except ValueError:
-            continue
-    return False
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # mkstemp membuat file 0600; pertahankan permission file lama (atau 0644)
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """write_bytes_atomic untuk teks UTF-8 (di-encode sekali, newline apa adanya)."""
+    write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def _dumps_config(data: Dict[str, Any]) -> bytes:
+    """
+    Serialisasi config ke UTF-8 JSON.
+
+    Tanpa orjson hasilnya byte-identik dengan format lama (json indent=4,
+    ASCII). orjson hanya mendukung indent 2, jadi dengan orjson terpasang
+    config.json ditulis ulang dengan indent 2 saat save pertama.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode("utf-8")
+
+
+def _loads_config(raw: bytes) -> Dict[str, Any]:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _resolve_default(value: str | None, default_path: Path) -> str:
@@ -106,26 +182,22 @@ def _resolve_default(value: str | None, default_path: Path) -> str:
 
 
 def load_config() -> Dict[str, Any]:
-    global _config_cache, _config_mtime
+    global _config_cache, _config_mtime_ns
 
     with _lock:
         ensure_directories()
 
         if not CONFIG_FILE_PATH.exists():
             _config_cache = DEFAULT_CONFIG.copy()
-            _config_mtime = 0.0
-            with CONFIG_FILE_PATH.open("w", encoding="utf-8") as fp:
-                json.dump(_config_cache, fp, indent=4)
+            _config_mtime_ns = 0
+            write_bytes_atomic(CONFIG_FILE_PATH, _dumps_config(_config_cache))
             return _config_cache
 
         # PERFORMANCE: Track file modification time for smart reload
-        _config_mtime = CONFIG_FILE_PATH.stat().st_mtime
+        _config_mtime_ns = CONFIG_FILE_PATH.stat().st_mtime_ns
 
-        with CONFIG_FILE_PATH.open("r", encoding="utf-8") as fp:
-            loaded = json.load(fp)
-
-        config: Dict[str, Any] = DEFAULT_CONFIG.copy()
-        config.update(loaded)
+        # Satu read bytes; parser (orjson/json) men-decode UTF-8 sendiri
+        config: Dict[str, Any] = {**DEFAULT_CONFIG, **_loads_config(CONFIG_FILE_PATH.read_bytes())}
 
         config["NAME_OUTPUT_FILE"] = _resolve_default(
             config.get("NAME_OUTPUT_FILE"), OUTPUT_DIR / "OutputAllNames.txt"
@@ -154,37 +226,70 @@ def get_config() -> Dict[str, Any]:
     Get config with smart reload on file modification.
     
     PERFORMANCE: Only reloads if config.json has been modified since last load.
-    Prevents stale data while avoiding unnecessary I/O.
+    Prevents stale data while avoiding unnecessary I/O: satu os.stat per
+    panggilan, dan path di config sudah di-resolve saat load sehingga
+    request tidak perlu join/resolve ulang.
     """
-    global _config_cache, _config_mtime
-    
-    # Check if config file has been modified
-    if _config_cache is not None and CONFIG_FILE_PATH.exists():
-        current_mtime = CONFIG_FILE_PATH.stat().st_mtime
-        if current_mtime > _config_mtime:
-            # Config file changed, reload
-            return load_config()
-    
     if _config_cache is None:
         return load_config()
-    
+
+    try:
+        current_mtime_ns = os.stat(CONFIG_FILE_PATH).st_mtime_ns
+    except OSError:
+        return _config_cache
+
+    # Bandingkan != (bukan >): file yang diganti dengan mtime lebih lama tetap terdeteksi
+    if current_mtime_ns != _config_mtime_ns:
+        return load_config()
+
     return _config_cache
 
 
 def save_config(data: Dict[str, Any]) -> None:
-    global _config_cache, _config_mtime
+    """
+    Simpan config ke config.json (atomik) dan jadikan cache aktif.
+
+    Jika hasil serialisasi sama dengan yang terakhir ditulis dan file belum
+    diubah dari luar (mtime sama), penulisan ke disk dilewati.
+    """
+    global _config_cache, _config_mtime_ns, _config_payload
     with _lock:
+        # Serialisasi sekali lalu satu write (json.dump menulis per potongan kecil)
+        payload = _dumps_config(data)
+        if payload == _config_payload:
+            try:
+                unchanged = os.stat(CONFIG_FILE_PATH).st_mtime_ns == _config_mtime_ns
+            except OSError:
+                unchanged = False
+            if unchanged:
+                _config_cache = data
+                return
+
         ensure_directories()
-        with CONFIG_FILE_PATH.open("w", encoding="utf-8") as fp:
-            json.dump(data, fp, indent=4)
+        write_bytes_atomic(CONFIG_FILE_PATH, payload)
         _config_cache = data
+        _config_payload = payload
         # Update mtime after saving
-        _config_mtime = CONFIG_FILE_PATH.stat().st_mtime
+        _config_mtime_ns = CONFIG_FILE_PATH.stat().st_mtime_ns
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
     return get_config().get(key, default)
 
 
+def set_config_value(key: str, value: Any) -> Dict[str, Any]:
+    """
+    Ubah satu key config, simpan, dan return dict config yang baru.
+
+    Copy-on-write: dict yang sedang dipakai sebagai snapshot oleh extractor
+    yang berjalan tidak ikut berubah; request berikutnya mendapat dict baru.
+    """
+    with _update_lock:
+        config = dict(get_config())
+        config[key] = value
+        save_config(config)
+        return config
+
+
 # Load once so the config file is ready for use.
 load_config()
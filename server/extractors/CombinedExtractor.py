@@ -0,0 +1,109 @@
+# CombinedExtractor.py
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from server.config import clean_path, get_config  # noqa: E402
+from server.extractors.NamesExtractor import list_all_names, write_names_text  # noqa: E402
+from server.extractors.TextEXtractor import TextBundler, log, prepare_output  # noqa: E402
+
+
+def run_combined(
+    folder_path: str,
+    names_output_file: str,
+    text_output_file: str,
+    exclude_file: str | None = None,
+    include_files: bool = True,
+    include_size: bool = False,
+    workers: int = 1,
+) -> bool:
+    """
+    Jalankan NamesExtractor (mode text) dan TextEXtractor dengan SATU traversal.
+
+    NamesExtractor yang menelusuri tree; setiap direktori yang dikunjungi
+    diteruskan ke TextBundler lewat hook on_directory. Direktori yang
+    dipangkas oleh filter just_me TextEXtractor tetap ditelusuri untuk daftar
+    nama, tetapi tidak lagi diproses isinya.
+
+    Return False jika salah satu output gagal ditulis.
+    """
+    text_output_path = Path(text_output_file)
+    if not prepare_output(folder_path, text_output_path):
+        return False
+
+    bundler = TextBundler(folder_path, text_output_path, exclude_file, formatted_output=True)
+    # Direktori yang masih aktif untuk sisi teks (setara dirs[:] = ... di TextEXtractor)
+    text_active = {folder_path}
+
+    def on_directory(root: str, dirs: list[os.DirEntry], files: list[os.DirEntry]) -> None:
+        if root not in text_active:
+            return
+        text_active.discard(root)
+        for directory in bundler.process_directory(root, list(dirs), files):
+            text_active.add(directory.path)
+
+    with bundler:
+        items = list_all_names(
+            folder_path=folder_path,
+            include_files=include_files,
+            include_size=include_size,
+            exclude_file=exclude_file,
+            workers=workers,
+            on_directory=on_directory,
+        )
+        names_output_path = Path(names_output_file)
+        names_ok = True
+        try:
+            write_names_text(items, names_output_path, include_size)
+            log(f"-> Daftar semua file/folder disimpan ke '{names_output_path}'.")
+        except Exception as exc:
+            names_ok = False
+            log(f"[!] Gagal menulis file output: {exc}")
+            # Bundling teks berjalan lewat on_directory selama generator dikonsumsi;
+            # habiskan sisa traversal agar bundle teks tetap lengkap
+            for _ in items:
+                pass
+    bundler.finish()
+    return names_ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List names and combine text files in a single traversal.")
+    parser.add_argument("--include-files", type=lambda x: x.lower() == "true", default=True)
+    parser.add_argument("--include-size", type=lambda x: x.lower() == "true", default=False)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Jumlah thread scandir paralel (1 = serial; naikkan untuk drive jaringan)",
+    )
+    args = parser.parse_args()
+
+    config_data = get_config()
+    folder = clean_path(os.environ.get("VT_FOLDER") or config_data.get("TARGET_FOLDER") or "")
+    if not folder:
+        log("[!] TARGET_FOLDER belum diset di config.json")
+        return
+
+    ok = run_combined(
+        folder_path=folder,
+        names_output_file=config_data.get("NAME_OUTPUT_FILE"),
+        text_output_file=config_data.get("OUTPUT_FILE") or str(Path("Output.txt")),
+        exclude_file=config_data.get("EXCLUDE_FILE_PATH"),
+        include_files=args.include_files,
+        include_size=args.include_size,
+        workers=args.workers,
+    )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
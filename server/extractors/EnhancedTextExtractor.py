@@ -1,18 +1,25 @@
 # Enhanced TextEXtractor.py dengan Progress Tracking
 from __future__ import annotations
 
+import mmap
 import os
+import re
 import sys
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import AbstractSet, BinaryIO, Callable, Optional
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from server.config import clean_path, get_config
+from server.config import EXTRACTED_LIST_FILE, clean_path, env_bool, get_config
+from server.extractors.filters import compile_tokens, looks_binary, read_patterns
+from server.extractors.traversal import parallel_walk
 from server.services.task_manager import TaskInfo
 
 # Encoding aman
@@ -31,106 +38,151 @@ WHITELIST_EXT = {
 
 # Memory management settings
 MAX_FILE_BYTES = 10 * 1024 * 1024  # 10MB
+OUTPUT_BUFFER_BYTES = 4 * 1024 * 1024  # Buffer tulis output 4 MiB: ratusan file kecil per write() syscall
+MMAP_MIN_BYTES = 64 * 1024  # File >= 64 KB di-mmap; di bawah itu satu read() lebih murah
+# Batas read-ahead reader thread (READ_WORKERS > 1) agar memori tetap terkendali
+READ_AHEAD_FILES = 64
+READ_AHEAD_BYTES = 64 * 1024 * 1024
+# Marker blok file, di-encode sekali (bukan per file)
+FORMATTED_SUFFIX = b"\nWA\n"
+PLAIN_SUFFIX = b"\n\n"
+# Linux: os.sendfile bisa file -> file, isi disalin kernel dari page cache ke output
+# (macOS/BSD hanya mendukung socket sebagai tujuan, Windows tidak punya os.sendfile)
+USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
 MEMORY_WARNING_THRESHOLD = 80  # 80% of available memory
+MEMORY_SAMPLE_TTL = 0.25  # Detik; get_memory_usage memakai ulang hasil terakhir selama ini
+_MEMINFO_RE = re.compile(rb"^(MemTotal|MemAvailable):\s+(\d+)", re.MULTILINE)
+# (waktu monotonic, persen) sampel memori terakhir
+_memory_sample: tuple[float, float] = (float("-inf"), 0.0)
 PROGRESS_UPDATE_INTERVAL = 0.1  # Update progress every 0.1 seconds
+# CD_PARALLEL_SCAN=1: scandir + stat() file dijalankan SCAN_WORKERS thread mendahului filter
+# (berguna untuk tree besar di HDD/drive jaringan); default traversal serial
+SCAN_WORKERS = 8
 
 
 def log(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
-def get_memory_usage() -> float:
-    """Get current memory usage as percentage"""
+def sendfile_into(out: BinaryIO, in_fd: int, size: int) -> bool:
+    """
+    Salin `size` byte pertama in_fd ke akhir out lewat os.sendfile (tanpa melewati userspace).
+
+    Buffer out di-flush dulu agar urutan byte terjaga. Return False jika kernel
+    menolak sendfile sebelum ada byte yang disalin, sehingga caller bisa
+    jatuh ke jalur mmap/read biasa.
+    """
+    out.flush()
+    out_fd = out.fileno()
+    offset = 0
+    while offset < size:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        except OSError:
+            if offset == 0:
+                return False
+            raise
+        if sent == 0:
+            break  # File menyusut sejak di-stat
+        offset += sent
+    return True
+
+
+def read_candidate(file_path: str) -> bytes | None:
+    """Baca isi file di reader thread; None jika terdeteksi binary."""
+    with open(file_path, "rb", buffering=0) as binary_file:
+        content = binary_file.read()
+    return None if looks_binary(content[:4096]) else content
+
+
+def _meminfo_percent() -> float | None:
+    """Persentase memori terpakai dari /proc/meminfo (Linux), rumus sama dengan psutil."""
     try:
-        import psutil
-        return psutil.virtual_memory().percent
-    except ImportError:
-        # Fallback for systems without psutil
-        return 0.0
+        with open("/proc/meminfo", "rb") as handle:
+            values = dict(_MEMINFO_RE.findall(handle.read()))
+    except OSError:
+        return None
+    total = int(values.get(b"MemTotal", 0))
+    available = values.get(b"MemAvailable")
+    if not total or available is None:
+        return None
+    return 100.0 * (total - int(available)) / total
 
 
-def looks_binary(sample: bytes) -> bool:
-    """Enhanced binary detection"""
-    if not sample:
-        return False
-    if b"\x00" in sample:
-        return True
-    non_text = sum(1 for byte in sample if byte < 9 or (13 < byte < 32) or byte > 126)
-    return non_text > len(sample) * 0.30
-
-
-def read_exclude_file(file_path: str) -> list[str]:
-    """Read exclusion patterns from file"""
-    path = Path(file_path)
-    if not path.exists():
-        return []
-    entries = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                entries.append(stripped)
-    return entries
-
-
-def is_excluded(root: str, filename: str, exclude_set: set[str], base_folder: str = "") -> bool:
-    """Enhanced exclusion checking"""
-    full_path = os.path.join(root, filename)
-    normalized_full = full_path.replace("\\", "/")
-    
+def get_memory_usage() -> float:
+    """
+    Get current memory usage as percentage.
+
+    Hasil di-cache MEMORY_SAMPLE_TTL detik: dipanggil per file, tetapi memori
+    sistem cukup diukur beberapa kali per detik. Linux membaca /proc/meminfo
+    langsung; platform lain memakai psutil jika terpasang.
+    """
+    global _memory_sample
+    now = time.monotonic()
+    sampled_at, percent = _memory_sample
+    if now - sampled_at < MEMORY_SAMPLE_TTL:
+        return percent
+
+    percent = _meminfo_percent()
+    if percent is None:
+        try:
+            import psutil
+            percent = psutil.virtual_memory().percent
+        except ImportError:
+            # Fallback for systems without psutil
+            percent = 0.0
+    _memory_sample = (now, percent)
+    return percent
+
+
+@lru_cache(maxsize=4096)
+def _rel_prefix(root: str, base_folder: str) -> str:
+    """
+    Prefix relative path untuk entry di dalam root (separator "/", diakhiri "/").
+
+    Di-cache per (root, base_folder): relpath dihitung sekali per direktori,
+    bukan sekali per file/subdirektori di dalamnya.
+    """
     if base_folder:
         try:
-            rel_path = os.path.relpath(full_path, base_folder).replace("\\", "/")
+            rel_root = os.path.relpath(root, base_folder).replace("\\", "/")
+            return "" if rel_root == "." else rel_root + "/"
         except ValueError:
-            rel_path = normalized_full
-    else:
-        rel_path = normalized_full
-    
-    for pattern in exclude_set:
-        if not pattern:
-            continue
-            
-        pattern_norm = pattern.replace("\\", "/")
-        
-        if pattern == filename:
-            return True
-        if pattern_norm == rel_path:
-            return True
-        if pattern_norm in rel_path:
-            return True
-        if pattern in filename:
-            return True
-    
-    return False
+            pass
+    return os.path.join(root, "").replace("\\", "/")
 
 
-def read_list_file(file_path: str) -> list[str]:
-    """Read inclusion patterns from file"""
-    path = Path(file_path)
-    if not path.exists():
-        return []
-    entries = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                entries.append(stripped)
-    return entries
+def is_excluded(root: str, filename: str, exclude_re: re.Pattern[str] | None, base_folder: str = "") -> bool:
+    """
+    Enhanced exclusion checking.
+
+    exclude_re adalah hasil compile_tokens(exclude_set): semua pattern digabung
+    menjadi satu regex, jadi satu search() pada relative path menggantikan loop
+    exact/substring per pattern (nama file selalu akhiran relative path).
+    """
+    if exclude_re is None:
+        return False
+    return exclude_re.search(_rel_prefix(root, base_folder) + filename) is not None
 
 
-def match_any_token(path_or_name: str, tokens_set: set[str]) -> bool:
-    """Enhanced token matching"""
-    if not tokens_set:
+def match_any_token(path_or_name: str, tokens_re: re.Pattern[str] | None) -> bool:
+    """Enhanced token matching: satu search() dengan regex gabungan compile_tokens(just_set)."""
+    if tokens_re is None:
         return True
-    normalized = path_or_name.replace("\\", "/")
-    for token in tokens_set:
-        if token and token in normalized:
-            return True
-    return False
+    return tokens_re.search(path_or_name.replace("\\", "/")) is not None
 
 
-def dir_should_keep(root_path: str, just_set: set[str], exclude_set: set[str], base_folder: str = "") -> bool:
-    """Enhanced directory filtering"""
+@lru_cache(maxsize=4096)
+def dir_should_keep(
+    root_path: str, just_set: AbstractSet[str], exclude_set: AbstractSet[str], base_folder: str = ""
+) -> bool:
+    """
+    Enhanced directory filtering.
+
+    Keputusan di-cache per direktori (frozenset dari read_patterns hashable, dan
+    hash-nya disimpan Python), jadi run berikutnya dengan list yang sama tidak
+    mengulang loop pattern untuk direktori yang sama.
+    """
     if not just_set:
         return True
     
@@ -142,6 +194,9 @@ def dir_should_keep(root_path: str, just_set: set[str], exclude_set: set[str], b
     else:
         rel_path = root_path.replace("\\", "/")
     
+    # Basename dihitung sekali, bukan per pattern
+    dir_name = os.path.basename(root_path)
+    
     for pattern in just_set:
         if not pattern:
             continue
@@ -152,7 +207,7 @@ def dir_should_keep(root_path: str, just_set: set[str], exclude_set: set[str], b
             return True
         if pattern_norm in rel_path or rel_path in pattern_norm:
             return True
-        if pattern == os.path.basename(root_path):
+        if pattern == dir_name:
             return True
         if "/" not in pattern and "\\" not in pattern:
             return True  # Filename pattern, keep directory
@@ -167,21 +222,34 @@ class ProgressTracker:
         self.task_info = task_info
         self.total_files = total_files
         self.processed_files = 0
-        self.last_progress_update = time.time()
+        self.last_progress_update = time.monotonic()
         self.current_file = ""
         self.start_time = time.time()
     
     def update(self, processed_files: int, current_file: str = ""):
-        """Update progress with current file info"""
+        """
+        Update progress with current file info.
+
+        Hitungan selalu disimpan, tetapi task_info hanya diperbarui paling sering
+        sekali per PROGRESS_UPDATE_INTERVAL (dan selalu saat file terakhir), bukan per file.
+        """
         self.processed_files = processed_files
         self.current_file = current_file
-        
+
+        now = time.monotonic()
+        if processed_files < self.total_files and now - self.last_progress_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        self.last_progress_update = now
+        self.flush()
+
+    def flush(self):
+        """Kirim hitungan terakhir ke task_info (dipanggil juga setelah loop selesai)."""
         if self.total_files > 0:
-            progress = (processed_files / self.total_files) * 100
+            progress = (self.processed_files / self.total_files) * 100
             self.task_info.update_progress(
                 progress=int(progress),
-                current_file=current_file,
-                processed_files=processed_files
+                current_file=self.current_file,
+                processed_files=self.processed_files
             )
     
     def get_estimated_remaining(self) -> Optional[float]:
@@ -205,7 +273,10 @@ def enhanced_combine_files_in_folder_recursive(
     progress_callback: Optional[Callable] = None
 ) -> dict:
     """
-    Enhanced file bundling dengan progress tracking dan memory management
+    Enhanced file bundling dengan progress tracking dan memory management.
+
+    task_info hanya dipakai untuk progress; status completed/failed ditetapkan
+    caller (lihat task_routes.run_text_extraction_task) setelah post-processing selesai.
     """
     output_path = Path(output_file_name)
     
@@ -222,13 +293,25 @@ def enhanced_combine_files_in_folder_recursive(
         return {"success": False, "error": "Invalid folder path"}
     
     # Load filters
-    exclude_set = set(read_exclude_file(exclude_file) if exclude_file else [])
-    just_me_path = get_config().get("JUST_ME_FILE_PATH")
-    just_set = set(read_list_file(just_me_path) if just_me_path else [])
+    exclude_set = read_patterns(exclude_file)
+    config = get_config()
+    just_me_path = config.get("JUST_ME_FILE_PATH")
+    # READ_WORKERS > 1: file dibaca di thread pool (sama dengan TextEXtractor), output tetap berurutan
+    read_workers = max(1, int(config.get("READ_WORKERS", 1)))
+    just_set = read_patterns(just_me_path)
+    # Pattern dikompilasi sekali per run (dan di-cache lintas run oleh compile_tokens)
+    exclude_re = compile_tokens(exclude_set)
+    just_re = compile_tokens(just_set)
     
     # Base folder for relative path calculation
     base_folder = os.path.abspath(folder_path)
     
+    # Alias lokal untuk fungsi yang dipanggil per entry
+    excluded = is_excluded
+    keep_dir = dir_should_keep
+    match_token = match_any_token
+    splitext = os.path.splitext
+    
     # Statistics tracking
     stats = {
         "total_files": 0,
@@ -239,39 +322,51 @@ def enhanced_combine_files_in_folder_recursive(
         "memory_peak": 0
     }
     
-    # First pass: Count total files untuk progress tracking
+    # Satu traversal: file yang lolos filter disimpan (path, size) sehingga fase proses
+    # tidak menelusuri ulang pohon, mengulang filter, atau stat() file kedua kali
+    candidates: list[tuple[str, int]] = []
     log(f"[*] Scanning for files to process...")
-    for root, dirs, files in os.walk(folder_path):
-        # Filter directories
-        dirs[:] = [d for d in dirs if not is_excluded(root, d, exclude_set, base_folder)]
-        
-        if just_set:
-            dirs[:] = [d for d in dirs if dir_should_keep(os.path.join(root, d), just_set, exclude_set, base_folder)]
-        
-        for filename in files:
+
+    # Filter directories: exclude + just_me sebelum child masuk antrean
+    def keep_subdir(root: str, d: os.DirEntry) -> bool:
+        return not excluded(root, d.name, exclude_re, base_folder) and (
+            not just_set or keep_dir(d.path, just_set, exclude_set, base_folder)
+        )
+
+    scan_workers = SCAN_WORKERS if env_bool("CD_PARALLEL_SCAN") else 1
+    # parallel_walk (scandir): dirs/files berupa DirEntry, tanpa listdir + stat per entry seperti os.walk;
+    # workers = 1 sama dengan iter_tree biasa
+    for root, dirs, files in parallel_walk(folder_path, scan_workers, keep_subdir, stat_files=True):
+        for entry in files:
+            filename = entry.name
+            
             # Check exclusions
-            if is_excluded(root, filename, exclude_set, base_folder):
+            if excluded(root, filename, exclude_re, base_folder):
+                stats["skipped_files"] += 1
                 continue
             
             # Check inclusion
-            if just_set:
-                file_path = os.path.join(root, filename)
-                if not match_any_token(file_path, just_set):
-                    continue
+            if just_re is not None and not match_token(entry.path, just_re):
+                stats["skipped_files"] += 1
+                continue
             
             # Check file type and size
-            ext = os.path.splitext(filename)[1].lower()
+            ext = splitext(filename)[1].lower()
             if WHITELIST_EXT and ext and ext not in WHITELIST_EXT:
+                stats["skipped_files"] += 1
                 continue
             
             try:
-                size = os.path.getsize(os.path.join(root, filename))
-                if size > MAX_FILE_BYTES:
-                    continue
-                stats["total_files"] += 1
+                size = entry.stat().st_size
             except Exception:
+                stats["skipped_files"] += 1
+                continue
+            if size > MAX_FILE_BYTES:
+                stats["skipped_files"] += 1
                 continue
+            candidates.append((entry.path, size))
     
+    stats["total_files"] = len(candidates)
     log(f"[*] Found {stats['total_files']} files to process")
     
     if task_info:
@@ -293,98 +388,110 @@ def enhanced_combine_files_in_folder_recursive(
         memory_usage = get_memory_usage()
         stats["memory_peak"] = max(stats["memory_peak"], memory_usage)
         
+        # Hanya peringatan: gc.collect() paksa per file tidak membebaskan buffer file
+        # (sudah dilepas refcount) dan justru menambah jeda saat memori sedang tertekan
         if memory_usage > MEMORY_WARNING_THRESHOLD:
             log(f"[!] Memory usage tinggi: {memory_usage:.1f}%")
-            # Trigger garbage collection
-            import gc
-            gc.collect()
     
     try:
-        with output_path.open("w", encoding="utf-8", errors="ignore") as out:
+        # Output dibuka sekali sebagai bytes (BufferedWriter 4 MiB, tanpa lapisan encoding teks);
+        # setiap blok file langsung ditulis (tanpa buffer gabungan di RAM)
+        with output_path.open("wb", buffering=OUTPUT_BUFFER_BYTES) as out:
+            write_parts = out.writelines
+            suffix = FORMATTED_SUFFIX if formatted_output else PLAIN_SUFFIX
             if formatted_output:
-                out.write(header_note)
+                out.write(header_note.encode("utf-8"))
             
-            # Second pass: Process files
-            for root, dirs, files in os.walk(folder_path):
-                # Memory check
-                check_memory_usage()
-                
-                # Filter directories
-                dirs[:] = [d for d in dirs if not is_excluded(root, d, exclude_set, base_folder)]
-                
-                if just_set:
-                    dirs[:] = [d for d in dirs if dir_should_keep(os.path.join(root, d), just_set, exclude_set, base_folder)]
-                
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    
-                    # Check exclusions
-                    if is_excluded(root, filename, exclude_set, base_folder):
-                        stats["skipped_files"] += 1
-                        continue
-                    
-                    # Check inclusion
-                    if just_set and not match_any_token(file_path, just_set):
-                        stats["skipped_files"] += 1
-                        continue
+            check_memory_usage()
+            
+            def make_prefix(file_path: str) -> bytes:
+                if formatted_output:
+                    return f"BA\n'{file_path}'\n".encode("utf-8", "ignore")
+                return f"----- {file_path} -----\n".encode("utf-8", "ignore")
+
+            def record_file(file_path: str, size: int) -> None:
+                # Update stats
+                stats["processed_files"] += 1
+                stats["total_size"] += size
+                extracted_files.append(file_path)
                     
-                    # Check file type
-                    ext = os.path.splitext(filename)[1].lower()
-                    if WHITELIST_EXT and ext and ext not in WHITELIST_EXT:
-                        stats["skipped_files"] += 1
-                        continue
+                # Update progress
+                if progress_tracker:
+                    progress_tracker.update(stats["processed_files"], file_path)
                     
-                    try:
-                        size = os.path.getsize(file_path)
-                        if size > MAX_FILE_BYTES:
-                            stats["skipped_files"] += 1
-                            continue
-                    except Exception:
-                        stats["skipped_files"] += 1
-                        continue
+                # Progress logging setiap 100 files
+                if stats["processed_files"] % 100 == 0:
+                    elapsed = time.time() - stats["start_time"]
+                    rate = stats["processed_files"] / elapsed
+                    eta = (stats["total_files"] - stats["processed_files"]) / rate if rate > 0 else 0
+                    log(f"[+] Processed: {stats['processed_files']}/{stats['total_files']} files ({stats['total_size'] / 1024 / 1024:.1f} MB) - ETA: {eta/60:.1f} min")
                     
+                # Memory check
+                check_memory_usage()
+
+            if read_workers > 1:
+                # Reader thread membaca file mendahului penulis (read() melepas GIL); hasil
+                # ditulis berurutan sesuai daftar kandidat agar output tetap deterministik.
+                # Read-ahead dibatasi jumlah file dan total byte supaya memori terkendali.
+                pending: deque[tuple[str, int, Future]] = deque()
+                pending_bytes = 0
+                with ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="enhanced-reader") as pool:
+                    for index, (file_path, size) in enumerate(candidates):
+                        pending.append((file_path, size, pool.submit(read_candidate, file_path)))
+                        pending_bytes += size
+                        last = index == len(candidates) - 1
+                        while pending and (
+                            last or len(pending) > READ_AHEAD_FILES or pending_bytes > READ_AHEAD_BYTES
+                        ):
+                            file_path, size, future = pending.popleft()
+                            pending_bytes -= size
+                            try:
+                                content = future.result()
+                                if content is None:
+                                    stats["skipped_files"] += 1
+                                else:
+                                    write_parts((make_prefix(file_path), content, suffix))
+                                    record_file(file_path, size)
+                            except Exception as exc:
+                                log(f"[!] Error processing '{file_path}': {exc}")
+                                stats["skipped_files"] += 1
+            else:
+                # Process files: langsung dari daftar kandidat hasil traversal
+                for file_path, size in candidates:
                     # Process file
                     try:
-                        # Binary detection
-                        with open(file_path, "rb") as binary_file:
-                            sample = binary_file.read(4096)
-                            if looks_binary(sample):
-                                stats["skipped_files"] += 1
-                                continue
-                        
-                        # Read content
-                        with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-                            content = handle.read()
-                        
-                        # Write to output
-                        if formatted_output:
-                            out.write("BA\n")
-                            out.write(f"'{file_path}'\n")
-                            out.write(content)
-                            out.write("\nWA\n")
-                        else:
-                            out.write(f"----- {file_path} -----\n")
-                            out.write(content)
-                            out.write("\n\n")
-                        
-                        # Update stats
-                        stats["processed_files"] += 1
-                        stats["total_size"] += size
-                        extracted_files.append(file_path)
-                        
-                        # Update progress
-                        if progress_tracker:
-                            progress_tracker.update(stats["processed_files"], file_path)
-                        
-                        # Progress logging setiap 100 files
-                        if stats["processed_files"] % 100 == 0:
-                            elapsed = time.time() - stats["start_time"]
-                            rate = stats["processed_files"] / elapsed
-                            eta = (stats["total_files"] - stats["processed_files"]) / rate if rate > 0 else 0
-                            log(f"[+] Processed: {stats['processed_files']}/{stats['total_files']} files ({stats['total_size'] / 1024 / 1024:.1f} MB) - ETA: {eta/60:.1f} min")
-                        
-                        # Memory check
-                        check_memory_usage()
+                        prefix = make_prefix(file_path)
+
+                        # Satu open untuk sniff binary dan isi; bytes diteruskan ke output
+                        # tanpa decode/encode ulang
+                        with open(file_path, "rb", buffering=0) as binary_file:
+                            if size >= MMAP_MIN_BYTES and USE_SENDFILE:
+                                # File besar di Linux: sniff 4096 byte dengan pread, isi disalin kernel
+                                in_fd = binary_file.fileno()
+                                if looks_binary(os.pread(in_fd, 4096, 0)):
+                                    stats["skipped_files"] += 1
+                                    continue
+                                out.write(prefix)
+                                if not sendfile_into(out, in_fd, size):
+                                    with mmap.mmap(in_fd, 0, access=mmap.ACCESS_READ) as mapped:
+                                        out.write(mapped)
+                                out.write(suffix)
+                            elif size >= MMAP_MIN_BYTES:
+                                # File besar: tulis langsung dari page cache (mmap), tanpa salinan di heap
+                                with mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                                    if looks_binary(mapped[:4096]):
+                                        stats["skipped_files"] += 1
+                                        continue
+                                    write_parts((prefix, mapped, suffix))
+                            else:
+                                # File kecil: satu read(), 4096 byte pertama untuk sniff
+                                content = binary_file.read()
+                                if looks_binary(content[:4096]):
+                                    stats["skipped_files"] += 1
+                                    continue
+                                write_parts((prefix, content, suffix))
+
+                        record_file(file_path, size)
                         
                     except Exception as exc:
                         log(f"[!] Error processing '{file_path}': {exc}")
@@ -393,18 +500,23 @@ def enhanced_combine_files_in_folder_recursive(
     except Exception as exc:
         log(f"[!] Fatal error: {exc}")
         return {"success": False, "error": str(exc)}
+
+    # Update terakhir yang mungkin tertahan throttle (mis. file terakhir ternyata binary)
+    if progress_tracker:
+        progress_tracker.flush()
     
     # Save extracted files list
     try:
-        project_output_dir = ROOT_DIR / "data" / "output"
-        project_output_dir.mkdir(parents=True, exist_ok=True)
-        extracted_list_path = project_output_dir / "OutputExtractedFiles.txt"
+        extracted_list_path = EXTRACTED_LIST_FILE
+        extracted_list_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Kumpulkan baris di list lalu satu join + satu write
+        lines = [f"{base_folder}; [FOLDER]\n"]
+        for file_path in extracted_files:
+            normalized_path = file_path.replace("\\", "/")
+            lines.append(f"{normalized_path}; [FILE]\n")
         with extracted_list_path.open("w", encoding="utf-8") as f:
-            f.write(f"{base_folder}; [FOLDER]\n")
-            for file_path in extracted_files:
-                normalized_path = file_path.replace("\\", "/")
-                f.write(f"{normalized_path}; [FILE]\n")
+            f.write("".join(lines))
         
         log(f"-> File list saved: '{extracted_list_path}'")
     except Exception as exc:
@@ -421,16 +533,6 @@ def enhanced_combine_files_in_folder_recursive(
     log(f"   Memory peak: {stats['memory_peak']:.1f}%")
     log(f"   Output: '{output_path}'")
     
-    if task_info:
-        task_info.complete({
-            "processed_files": stats["processed_files"],
-            "total_size": stats["total_size"],
-            "skipped_files": stats["skipped_files"],
-            "elapsed_time": elapsed_time,
-            "memory_peak": stats["memory_peak"],
-            "output_file": str(output_path)
-        })
-    
     return {
         "success": True,
         "stats": stats,
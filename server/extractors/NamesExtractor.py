@@ -2,16 +2,31 @@
 from __future__ import annotations
 
 import argparse
+import contextvars
+import io
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Callable, Iterator, TextIO
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from server.config import clean_path, get_config  # noqa: E402
+from server.extractors.filters import compile_tokens, read_patterns  # noqa: E402
+from server.extractors.traversal import folder_size, parallel_walk  # noqa: E402
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 config_data = get_config()
 
@@ -22,101 +37,90 @@ try:
 except Exception:
     pass  # older Python fallback
 
+NDJSON_FLUSH_EVERY = 1024
+
+# Satu thread penulis NAME_OUTPUT_FILE untuk pemanggilan in-process: response
+# tidak menunggu write, dan urutan FIFO menjamin hasil run terbaru yang tersimpan
+_persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="names-persist")
+
 # --- GLOBAL logger switch ---
 is_json_out = False
 
+# Tujuan log() saat dipanggil in-process dari server (None = perilaku CLI)
+_log_sink: ContextVar[TextIO | None] = ContextVar("namesextractor_log_sink", default=None)
+
 
 def log(*args, **kwargs):
     """Kirim log ke stderr saat output mode JSON, agar stdout tetap 'bersih' untuk JSON."""
-    if is_json_out:
+    sink = _log_sink.get()
+    if sink is not None:
+        print(*args, file=sink, **kwargs)
+    elif is_json_out:
         print(*args, file=sys.stderr, **kwargs)
     else:
         print(*args, **kwargs)
 
 
-def format_file_size(size_bytes: int) -> str:
-    if size_bytes == 0:
-        return "0 B"
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    idx = 0
-    size = float(size_bytes)
-    while size >= 1024 and idx < len(size_names) - 1:
-        size /= 1024.0
-        idx += 1
-    return f"{size:.1f} {size_names[idx]}"
+class _NullLog(io.TextIOBase):
+    """Sink log yang membuang semua tulisan (log in-process tidak dibaca siapa pun)."""
 
+    def write(self, text: str) -> int:
+        return len(text)
 
-def get_folder_size(folder_path: str) -> int:
-    total_size = 0
-    try:
-        for root, _, files in os.walk(folder_path):
-            for filename in files:
-                full_path = os.path.join(root, filename)
-                try:
-                    if not os.path.islink(full_path):
-                        total_size += os.path.getsize(full_path)
-                except (OSError, IOError):
-                    pass
-    except (OSError, IOError):
-        pass
-    return total_size
+
+_NULL_LOG = _NullLog()
 
 
-def get_item_size(item_path: str) -> tuple[int, str]:
+@contextmanager
+def quiet_log() -> Iterator[None]:
+    """Buang semua log() di thread/context ini agar tidak tercetak ke stdout server."""
+    token = _log_sink.set(_NULL_LOG)
     try:
-        if os.path.isfile(item_path):
-            size_bytes = os.path.getsize(item_path)
-        elif os.path.isdir(item_path):
-            size_bytes = get_folder_size(item_path)
-        else:
-            return 0, "0 B"
-        return size_bytes, format_file_size(size_bytes)
-    except (OSError, IOError):
-        return 0, "0 B"
-
-
-def read_list_file(file_path: str) -> list[str]:
-    if not file_path or not os.path.exists(file_path):
-        return []
-    items: list[str] = []
-    with open(file_path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                items.append(stripped)
-    return items
-
-
-def match_any_token(value: str, tokens: set[str]) -> bool:
-    if not tokens:
-        return True
-    value_norm = value.replace("\\", "/")
-    for token in tokens:
-        if token and token in value_norm:
-            return True
-    return False
+        yield
+    finally:
+        _log_sink.reset(token)
+
+
+def dumps_item(item: dict) -> bytes:
+    """Serialisasi satu item ke UTF-8 JSON; pakai orjson jika terpasang."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(item)
+    return json.dumps(item, ensure_ascii=False).encode("utf-8")
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
-def read_exclude_file(file_path: str) -> list[str]:
-    if not file_path or not os.path.exists(file_path):
-        return []
-    excluded: list[str] = []
-    with open(file_path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                excluded.append(stripped)
-    return excluded
+def format_file_size(size_bytes: int) -> str:
+    if size_bytes == 0:
+        return "0 B"
+    # Satuan langsung dari jumlah bit: tiap 10 bit = naik satu satuan (1024)
+    idx = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {SIZE_UNITS[idx]}"
+
+
+def match_any_token(value: str, tokens_re: re.Pattern[str] | None) -> bool:
+    """Satu search() dengan regex gabungan compile_tokens(tokens); None = semua cocok."""
+    if tokens_re is None:
+        return True
+    return tokens_re.search(value.replace("\\", "/")) is not None
 
 
-def is_excluded_path(root: str, filename: str, exclude_set: set[str], base_folder: str = "") -> bool:
+def is_excluded_path(root: str, filename: str, exclude_re: re.Pattern[str] | None, base_folder: str = "") -> bool:
     """
     Cek apakah file/folder harus di-exclude berdasarkan path lengkap.
     Mendukung:
     - Nama file: page.html
     - Path relatif: src/pages/page.html
     - Pattern substring: /node_modules/, .log
+    - Glob: *.log, build/*
+
+    exclude_re adalah hasil compile_tokens(exclude_set); nama file selalu
+    akhiran relative path, jadi satu search() mencakup semua bentuk di atas.
     """
+    if exclude_re is None:
+        return False
+
     full_path = os.path.join(root, filename)
     
     # Buat relative path jika base folder ada
@@ -128,37 +132,18 @@ def is_excluded_path(root: str, filename: str, exclude_set: set[str], base_folde
     else:
         rel_path = full_path.replace("\\", "/")
     
-    # Cek setiap pattern
-    for pattern in exclude_set:
-        if not pattern:
-            continue
-        
-        pattern_norm = pattern.replace("\\", "/")
-        
-        # Exact match nama file
-        if pattern == filename:
-            return True
-        
-        # Exact match relative path
-        if pattern_norm == rel_path:
-            return True
-        
-        # Substring match
-        if pattern_norm in rel_path:
-            return True
-        
-        # Backward compatibility: nama file saja
-        if pattern in filename:
-            return True
-    
-    return False
+    return exclude_re.search(rel_path) is not None
 
 
-def matches_just_pattern(path: str, filename: str, just_set: set[str], base_folder: str = "") -> bool:
+def matches_just_pattern(path: str, filename: str, just_re: re.Pattern[str] | None, base_folder: str = "") -> bool:
     """
     Cek apakah file match dengan pattern di just_me list.
+
+    just_re adalah hasil compile_tokens(just_set), matcher yang sama dengan
+    TextEXtractor/EnhancedTextExtractor (substring literal + glob). Exact
+    match dan nama file tercakup karena keduanya akhiran relative path.
     """
-    if not just_set:
+    if just_re is None:
         return True
     
     # Buat relative path
@@ -170,122 +155,288 @@ def matches_just_pattern(path: str, filename: str, just_set: set[str], base_fold
     else:
         rel_path = path.replace("\\", "/")
     
-    # Cek setiap pattern
-    for pattern in just_set:
-        if not pattern:
-            continue
-        
-        pattern_norm = pattern.replace("\\", "/")
-        
-        # Exact match
-        if pattern_norm == rel_path:
-            return True
-        
-        # Substring match
-        if pattern_norm in rel_path:
-            return True
-        
-        # Filename match
-        if pattern == filename:
-            return True
-    
-    return False
+    return just_re.search(rel_path) is not None
 
 
-def add_files_to_list(
-    all_items: list[dict], 
-    files: list[str], 
+def iter_file_items(
+    files: list[os.DirEntry], 
     root: str, 
-    exclude_set: set[str], 
-    just_set: set[str],
+    exclude_re: re.Pattern[str] | None, 
+    just_re: re.Pattern[str] | None,
     include_size: bool,
     base_folder: str = ""
-) -> None:
-    for filename in files:
+) -> Iterator[dict]:
+    # Alias lokal untuk fungsi global yang dipanggil per file
+    excluded = is_excluded_path
+    just_matches = matches_just_pattern
+    for entry in files:
+        filename = entry.name
+
         # Cek exclude
-        if is_excluded_path(root, filename, exclude_set, base_folder):
+        if excluded(root, filename, exclude_re, base_folder):
             continue
         
-        file_path = os.path.join(root, filename)
+        file_path = entry.path
         
         # Cek just_me
-        if just_set and not matches_just_pattern(file_path, filename, just_set, base_folder):
+        if just_re is not None and not just_matches(file_path, filename, just_re, base_folder):
             continue
         
         if include_size:
-            size_bytes, formatted_size = get_item_size(file_path)
-            all_items.append(
-                {
-                    "path": file_path,
-                    "type": "FILE",
-                    "size_bytes": size_bytes,
-                    "formatted_size": formatted_size,
-                }
-            )
+            # entry.stat() mengikuti symlink seperti os.path.getsize (symlink rusak = 0 B).
+            # Untuk non-symlink DirEntry memakai ulang hasil lstat yang sudah di-cache
+            # saat menghitung ukuran folder, jadi tidak ada syscall kedua.
+            # formatted_size diisi saat item di-emit.
+            try:
+                size_bytes = entry.stat().st_size
+            except OSError:
+                size_bytes = 0
+            yield {"path": file_path, "type": "FILE", "size_bytes": size_bytes}
         else:
-            all_items.append({"path": file_path, "type": "FILE"})
-
-
-def list_all_names(folder_path: str, include_files: bool = True, include_size: bool = False, exclude_file: str | None = None) -> list[dict]:
+            yield {"path": file_path, "type": "FILE"}
+
+
+def list_all_names(
+    folder_path: str,
+    include_files: bool = True,
+    include_size: bool = False,
+    exclude_file: str | None = None,
+    workers: int = 1,
+    on_directory: Callable[[str, list[os.DirEntry], list[os.DirEntry]], None] | None = None,
+    just_me_file: str | None = None,
+) -> Iterator[dict]:
+    """
+    Generator item FOLDER/FILE dalam urutan penelusuran.
+
+    Tanpa include_size item di-yield langsung saat direktori dibaca. Dengan
+    include_size item ditahan sampai traversal selesai karena ukuran folder
+    baru diketahui setelah seluruh subtree-nya dihitung.
+    on_directory(root, dirs, files) dipanggil untuk setiap direktori yang
+    dikunjungi (dirs sudah tanpa exclude), agar caller bisa ikut memakai
+    traversal yang sama.
+    """
     if not os.path.isdir(folder_path):
         log(f"[!] Error: Folder '{folder_path}' tidak ditemukan atau bukan direktori.")
-        return []
+        return
 
     all_items: list[dict] = []
-    exclude_names = read_exclude_file(exclude_file) if exclude_file else []
-    exclude_set = set(exclude_names)
+    exclude_re = compile_tokens(read_patterns(exclude_file))
 
-    just_me_path = config_data.get("JUST_ME_FILE_PATH")
-    just_set = set(read_list_file(just_me_path) if just_me_path else [])
+    just_me_path = config_data.get("JUST_ME_FILE_PATH") if just_me_file is None else just_me_file
+    just_re = compile_tokens(read_patterns(just_me_path))
 
     # Base folder untuk relative path calculation
     base_folder = os.path.abspath(folder_path)
 
     log(f"-> Memulai penelusuran dari direktori: {folder_path}")
 
-    for root, dirs, files in os.walk(folder_path):
-        # Filter direktori yang di-exclude
-        dirs[:] = [
-            d for d in dirs 
-            if not is_excluded_path(root, d, exclude_set, base_folder)
-        ]
+    # Ukuran folder dihitung bottom-up dalam satu traversal:
+    # own_sizes = file langsung di folder (+ subtree yang di-exclude),
+    # lalu dijumlahkan ke parent setelah traversal selesai.
+    own_sizes: dict[str, int] = {}
+    subdirs_of: dict[str, list[str]] = {}
+    visit_order: list[str] = []
+    folder_items: dict[str, dict] = {}
+    pruned_dirs: list[tuple[str, str]] = []
+
+    # Direktori yang di-exclude disaring sebelum ditelusuri (workers > 1 = scandir paralel)
+    def keep_dir(root: str, entry: os.DirEntry) -> bool:
+        if not is_excluded_path(root, entry.name, exclude_re, base_folder):
+            return True
+        # Ukuran folder tetap menghitung subtree yang di-exclude (symlink tidak diikuti)
+        if include_size and not entry.is_symlink():
+            pruned_dirs.append((root, entry.path))
+        return False
+
+    for root, dirs, files in parallel_walk(folder_path, workers, keep_dir):
+        if on_directory is not None:
+            on_directory(root, dirs, files)
 
-        # Jika just_set ada, filter direktori berdasarkan just_set juga
-        if just_set:
-            # Cek apakah ada child yang match dengan just_set
+        if include_size:
+            visit_order.append(root)
+            subdirs_of[root] = [d.path for d in dirs if not d.is_symlink()]
+            own_size = 0
+            for entry in files:
+                try:
+                    if not entry.is_symlink():
+                        own_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+            own_sizes[root] = own_size
+
+        # Jika just_me ada, filter direktori berdasarkan just_me juga
+        if just_re is not None:
+            # Cek apakah ada child yang match dengan just_me
             def has_matching_child() -> bool:
                 # Cek direktori
                 for directory in dirs:
-                    dir_path = os.path.join(root, directory)
-                    if matches_just_pattern(dir_path, directory, just_set, base_folder):
+                    if matches_just_pattern(directory.path, directory.name, just_re, base_folder):
                         return True
                 
                 # Cek files
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    if matches_just_pattern(file_path, filename, just_set, base_folder):
+                for entry in files:
+                    if matches_just_pattern(entry.path, entry.name, just_re, base_folder):
                         return True
                 
                 return False
             
             # Tampilkan folder jika ada child yang match atau folder sendiri yang match
-            show_folder = has_matching_child() or matches_just_pattern(root, os.path.basename(root), just_set, base_folder)
+            show_folder = has_matching_child() or matches_just_pattern(root, os.path.basename(root), just_re, base_folder)
         else:
             show_folder = True
 
         if show_folder:
             if include_size:
-                size_bytes, formatted_size = get_item_size(root)
-                all_items.append(
-                    {"path": root, "type": "FOLDER", "size_bytes": size_bytes, "formatted_size": formatted_size}
-                )
+                # size diisi setelah seluruh subtree selesai dihitung
+                folder_item = {"path": root, "type": "FOLDER", "size_bytes": 0}
+                folder_items[root] = folder_item
+                all_items.append(folder_item)
             else:
-                all_items.append({"path": root, "type": "FOLDER"})
+                yield {"path": root, "type": "FOLDER"}
 
         if include_files:
-            add_files_to_list(all_items, files, root, exclude_set, just_set, include_size, base_folder)
+            file_items = iter_file_items(files, root, exclude_re, just_re, include_size, base_folder)
+            if include_size:
+                all_items.extend(file_items)
+            else:
+                yield from file_items
 
-    return all_items
+    if include_size:
+        for parent, pruned_path in pruned_dirs:
+            own_sizes[parent] = own_sizes.get(parent, 0) + folder_size(pruned_path, workers)
+
+        # Urutan kunjungan terbalik = child selalu selesai sebelum parent
+        folder_sizes: dict[str, int] = {}
+        for root in reversed(visit_order):
+            folder_sizes[root] = own_sizes[root] + sum(
+                folder_sizes.get(child, 0) for child in subdirs_of[root]
+            )
+
+        for root, folder_item in folder_items.items():
+            folder_item["size_bytes"] = folder_sizes.get(root, 0)
+
+        # Format ukuran baru dilakukan saat emit (satu tempat untuk FILE dan FOLDER)
+        for item in all_items:
+            item["formatted_size"] = format_file_size(item["size_bytes"])
+            yield item
+
+
+def format_name_line(item: dict, include_size: bool) -> str:
+    """Satu baris format `path; [TYPE]` (+ `; size_bytes; formatted_size`)."""
+    if include_size and "size_bytes" in item:
+        return f"{item['path']}; [{item['type']}]; {item['size_bytes']}; {item['formatted_size']}\n"
+    return f"{item['path']}; [{item['type']}]\n"
+
+
+def write_names_text(items: Iterator[dict], output_path: Path, include_size: bool) -> None:
+    """Tulis item ke file teks format `path; [TYPE]` (+ `; size_bytes; formatted_size`)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8") as handle:
+        for item in items:
+            handle.write(format_name_line(item, include_size))
+
+
+def _persist_text(output_path: Path, content: str) -> None:
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(content, encoding="utf-8")
+    except Exception as exc:
+        log(f"[!] Gagal menulis file output: {exc}")
+
+
+def _config_items(
+    config: dict, include_files: bool, include_size: bool, folder_override: str | None
+) -> Iterator[dict]:
+    folder = clean_path(folder_override or os.environ.get("VT_FOLDER") or config.get("TARGET_FOLDER") or "")
+    if not folder:
+        raise ValueError("TARGET_FOLDER belum diset di config.json")
+
+    return list_all_names(
+        folder_path=folder,
+        include_files=include_files,
+        include_size=include_size,
+        exclude_file=config.get("EXCLUDE_FILE_PATH"),
+        just_me_file=config.get("JUST_ME_FILE_PATH"),
+    )
+
+
+def run_names_text(
+    config: dict, include_files: bool = True, include_size: bool = False, folder_override: str | None = None
+) -> str:
+    """
+    Jalankan NamesExtractor in-process (mode text) dengan snapshot config terbaru.
+
+    Teks dikembalikan langsung sehingga caller tidak perlu membaca ulang file
+    dari disk. NAME_OUTPUT_FILE tetap ditulis seperti mode CLI `--format text`,
+    tetapi di background thread agar caller tidak menunggu write selesai.
+    """
+    # Log dibuang (dulu stdout subprocess juga dibuang); write background ikut
+    # memakai context ini agar pesan gagal tulis juga tidak ke stdout server
+    with quiet_log():
+        items = _config_items(config, include_files, include_size, folder_override)
+        content = "".join(format_name_line(item, include_size) for item in items)
+        context = contextvars.copy_context()
+
+    _persist_executor.submit(context.run, _persist_text, Path(config.get("NAME_OUTPUT_FILE")), content)
+    return content
+
+
+def run_names_file(
+    config: dict, include_files: bool = True, include_size: bool = False, folder_override: str | None = None
+) -> Path:
+    """
+    Seperti run_names_text, tetapi item langsung di-stream ke NAME_OUTPUT_FILE
+    tanpa menyusun seluruh teks di memori. Return path file output.
+    """
+    with quiet_log():
+        items = _config_items(config, include_files, include_size, folder_override)
+        output_path = Path(config.get("NAME_OUTPUT_FILE"))
+        # Lewat executor yang sama agar tidak ditimpa write background yang masih
+        # antre; item dikonsumsi di thread itu, jadi context (sink log) ikut dibawa
+        context = contextvars.copy_context()
+        _persist_executor.submit(context.run, write_names_text, items, output_path, include_size).result()
+    return output_path
+
+
+def iter_names_json(
+    config: dict,
+    include_files: bool = True,
+    include_size: bool = False,
+    folder_override: str | None = None,
+    chunk_bytes: int = 64 * 1024,
+) -> Iterator[bytes]:
+    """
+    Jalankan NamesExtractor in-process dan hasilkan array JSON (seperti
+    `--format json`) sebagai potongan bytes UTF-8 berukuran ~chunk_bytes.
+
+    Pengganti spawn `python NamesExtractor.py --format json`: tanpa startup
+    interpreter, parsing argv, dan pipe stdout per request.
+    """
+    chunks = _iter_json_chunks(
+        _config_items(config, include_files, include_size, folder_override), chunk_bytes
+    )
+    # Traversal berjalan lazy saat response di-iterasi. Sink dipasang dan
+    # dilepas di sekitar tiap langkah (tanpa yield di antaranya), jadi tidak
+    # pernah tertinggal di context yang sedang meng-iterasi response
+    while True:
+        with quiet_log():
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _iter_json_chunks(items: Iterator[dict], chunk_bytes: int) -> Iterator[bytes]:
+    buffer = bytearray(b"[")
+    for index, item in enumerate(items):
+        if index:
+            buffer += b","
+        buffer += dumps_item(item)
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
 
 
 def main() -> None:
@@ -294,10 +445,21 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="List files and folders recursively.")
     parser.add_argument("--include-files", type=lambda x: x.lower() == "true", default=True)
     parser.add_argument("--include-size", type=lambda x: x.lower() == "true", default=False)
-    parser.add_argument("--format", choices=["json", "text"], default="json")
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson", "text"],
+        default="json",
+        help="json = satu array; ndjson = satu objek JSON per baris (bisa diproses sambil jalan); text = NAME_OUTPUT_FILE",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Jumlah thread scandir paralel (1 = serial; naikkan untuk drive jaringan)",
+    )
     args = parser.parse_args()
 
-    is_json_out = args.format == "json"
+    is_json_out = args.format in ("json", "ndjson")
 
     folder = clean_path(os.environ.get("VT_FOLDER") or config_data.get("TARGET_FOLDER") or "")
     if not folder:
@@ -309,25 +471,41 @@ def main() -> None:
         include_files=args.include_files,
         include_size=args.include_size,
         exclude_file=config_data.get("EXCLUDE_FILE_PATH"),
+        workers=args.workers,
     )
 
     if args.format == "json":
-        sys.stdout.write(json.dumps(items, ensure_ascii=False))
+        # Tulis array JSON per item (bytes langsung ke stdout) agar tidak ada string raksasa di memori
+        out = sys.stdout.buffer
+        write = out.write
+        write(b"[")
+        for index, item in enumerate(items):
+            if index:
+                write(b",")
+            write(dumps_item(item))
+        write(b"]")
+        try:
+            out.flush()
+        except Exception:
+            pass
+    elif args.format == "ndjson":
+        # Satu item per baris; flush berkala agar consumer bisa mulai parsing sebelum traversal selesai
+        out = sys.stdout.buffer
+        write = out.write
+        for index, item in enumerate(items, 1):
+            write(dumps_item(item))
+            write(b"\n")
+            if index % NDJSON_FLUSH_EVERY == 0:
+                out.flush()
         try:
-            sys.stdout.flush()
+            out.flush()
         except Exception:
             pass
     else:
         output_file_name = config_data.get("NAME_OUTPUT_FILE")
         try:
             output_path = Path(output_file_name)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("w", encoding="utf-8") as handle:
-                for item in items:
-                    if args.include_size and "size_bytes" in item:
-                        handle.write(f"{item['path']}; [{item['type']}]; {item['size_bytes']}; {item['formatted_size']}\n")
-                    else:
-                        handle.write(f"{item['path']}; [{item['type']}]\n")
+            write_names_text(items, output_path, args.include_size)
             log(f"\n-> Berhasil! Daftar semua file/folder disimpan ke '{output_path}'.")
         except Exception as exc:
             log(f"\n[!] Gagal menulis file output: {exc}")
@@ -1,15 +1,26 @@
 # TextEXtractor.py
 from __future__ import annotations
 
+import io
+import mmap
 import os
+import re
 import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import AbstractSet, Callable, Iterator, TextIO
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from server.config import clean_path, get_config  # noqa: E402
+from server.config import EXTRACTED_LIST_FILE, clean_path, get_config  # noqa: E402
+from server.extractors.filters import compile_tokens, looks_binary, read_patterns  # noqa: E402
+from server.extractors.traversal import iter_tree  # noqa: E402
 
 # Encoding aman
 try:
@@ -53,348 +64,502 @@ WHITELIST_EXT = {
     ".vue",
     ".xml",
 }
+WHITELIST_SUFFIXES = tuple(WHITELIST_EXT) if WHITELIST_EXT is not None else None
 # Increased from 2MB to 10MB for larger source files
 # Can be overridden in config.json with MAX_FILE_SIZE_MB
 MAX_FILE_BYTES = config_data.get("MAX_FILE_SIZE_MB", 10) * 1024 * 1024
+OUTPUT_BUFFER_BYTES = 1024 * 1024
+# File >= 64 KB di-mmap; di bawah itu overhead mmap lebih mahal dari read() biasa
+MMAP_MIN_BYTES = 64 * 1024
+# POSIX: open file relatif terhadap fd direktori, resolusi path tidak diulang dari "/"
+USE_DIR_FD = os.open in os.supports_dir_fd
+# Batas read-ahead agar memori tetap terkendali
+READ_AHEAD_FILES = 64
+READ_AHEAD_BYTES = 64 * 1024 * 1024
+# Cache isi file kecil antar run in-process (route Flask). Hidup selama proses
+# server, jadi default-nya kecil; CD_CONTENT_CACHE_MB=0 mematikannya
+CONTENT_CACHE_BYTES = max(0, int(os.environ.get("CD_CONTENT_CACHE_MB", "32"))) * 1024 * 1024
+
+
+# Tujuan log saat dijalankan in-process (mis. dari route Flask); default stderr
+_log_sink: ContextVar[TextIO | None] = ContextVar("textextractor_log_sink", default=None)
 
 
 def log(*args, **kwargs):
-    print(*args, file=sys.stderr, **kwargs)
+    print(*args, file=_log_sink.get() or sys.stderr, **kwargs)
 
 
-def looks_binary(sample: bytes) -> bool:
-    if not sample:
-        return False
-    if b"\x00" in sample:
-        return True
-    non_text = sum(1 for byte in sample if byte < 9 or (13 < byte < 32) or byte > 126)
-    return non_text > len(sample) * 0.30
+@contextmanager
+def capture_log() -> Iterator[io.StringIO]:
+    """Tampung semua log() di thread/context ini ke StringIO (pengganti stderr subprocess)."""
+    buffer = io.StringIO()
+    token = _log_sink.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _log_sink.reset(token)
 
 
-def read_exclude_file(file_path: str) -> list[str]:
-    path = Path(file_path)
-    if not path.exists():
-        return []
-    entries: list[str] = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                entries.append(stripped)
-    return entries
+class ContentCache:
+    """
+    LRU isi file teks kecil, valid selama (st_mtime_ns, st_size) file sama.
 
+    Dipakai saat extractor dijalankan berulang dalam satu proses: file yang
+    tidak berubah sejak run sebelumnya tidak dibuka dan dibaca ulang.
+    """
 
-def is_excluded(root: str, filename: str, exclude_set: set[str], base_folder: str = "") -> bool:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, tuple[tuple[int, int], bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, signature: tuple[int, int]) -> bytes | None:
+        with self._lock:
+            item = self._items.get(path)
+            if item is None or item[0] != signature:
+                return None
+            self._items.move_to_end(path)
+            return item[1]
+
+    def put(self, path: str, signature: tuple[int, int], content: bytes) -> None:
+        with self._lock:
+            old = self._items.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+            # File yang lebih besar dari seluruh cache tidak boleh mengusir isi lain
+            if len(content) > self.max_bytes:
+                return
+            self._items[path] = (signature, content)
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes and self._items:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+
+
+content_cache = ContentCache(CONTENT_CACHE_BYTES)
+
+
+def read_source(file_path: str) -> bytes | None:
+    """Baca isi file untuk reader thread; None jika terdeteksi binary."""
+    with open(file_path, "rb", buffering=0) as binary_file:
+        content = binary_file.read()
+    return None if looks_binary(content[:4096]) else content
+
+
+def is_excluded(rel_path: str, exclude_re: re.Pattern[str] | None) -> bool:
     """
     Cek apakah file/folder harus di-exclude.
     Sekarang mendukung:
     - Nama file saja: page.html
     - Path relatif: src/pages/page.html
-    - Pattern: **/node_modules/**, *.log
-    """
-    # Buat full path dan relative path
-    full_path = os.path.join(root, filename)
-    normalized_full = full_path.replace("\\", "/")
-    
-    # Buat relative path dari base folder jika ada
-    if base_folder:
-        try:
-            rel_path = os.path.relpath(full_path, base_folder).replace("\\", "/")
-        except ValueError:
-            rel_path = normalized_full
-    else:
-        rel_path = normalized_full
-    
-    # Cek setiap pattern di exclude_set
-    for pattern in exclude_set:
-        if not pattern:
-            continue
-            
-        pattern_norm = pattern.replace("\\", "/")
-        
-        # Exact match dengan nama file
-        if pattern == filename:
-            return True
-        
-        # Exact match dengan relative path
-        if pattern_norm == rel_path:
-            return True
-        
-        # Substring match untuk path
-        if pattern_norm in rel_path:
-            return True
-        
-        # Substring match untuk nama file (backward compatibility)
-        if pattern in filename:
-            return True
-    
-    return False
-
+    - Pattern substring: /node_modules/, .log
 
-def read_list_file(file_path: str) -> list[str]:
-    path = Path(file_path)
-    if not path.exists():
-        return []
-    entries: list[str] = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                entries.append(stripped)
-    return entries
+    rel_path adalah path relatif terhadap base folder dengan separator "/",
+    exclude_re adalah hasil compile_tokens(exclude_set). Nama file selalu
+    merupakan akhiran relative path, jadi satu search() pada relative path
+    sudah mencakup exact match nama file, exact match path, dan substring.
+    """
+    return exclude_re is not None and exclude_re.search(rel_path) is not None
 
 
-def match_any_token(path_or_name: str, tokens_set: set[str]) -> bool:
-    if not tokens_set:
+def match_any_token(path_or_name: str, tokens_re: re.Pattern[str] | None) -> bool:
+    """Satu search() dengan regex gabungan compile_tokens(tokens); None = semua cocok."""
+    if tokens_re is None:
         return True
-    normalized = path_or_name.replace("\\", "/")
-    for token in tokens_set:
-        if token and token in normalized:
-            return True
-    return False
+    return tokens_re.search(path_or_name.replace("\\", "/")) is not None
 
 
-def dir_should_keep(root_path: str, just_set: set[str], exclude_set: set[str], base_folder: str = "") -> bool:
+def make_dir_keeper(just_set: AbstractSet[str]) -> Callable[[str, str], bool] | None:
     """
-    Tentukan apakah direktori harus di-keep berdasarkan just_me list.
-    Sekarang mendukung path lengkap.
+    Bangun filter direktori just_me sekali per run.
+    Sekarang mendukung path lengkap (rel_path relatif terhadap base folder, separator "/").
+
+    Return callable (rel_path, dir_name) -> bool, atau None jika semua
+    direktori harus di-keep.
     
-    **IMPORTANT:** Jika just_set hanya berisi filenames (bukan folder paths),
+    **IMPORTANT:** Jika just_set berisi filename (tanpa / atau \\),
     maka SEMUA directories harus di-keep agar bisa scan nested files.
+
+    Aturan per pattern (exact match, pattern di dalam rel_path, rel_path di
+    dalam pattern, nama direktori == pattern) digabung: satu regex literal
+    untuk arah pertama, satu substring search pada gabungan pattern untuk
+    arah kedua, satu lookup set untuk nama.
     """
     if not just_set:
-        return True
-    
-    # Buat relative path jika base folder ada
-    if base_folder:
-        try:
-            rel_path = os.path.relpath(root_path, base_folder).replace("\\", "/")
-        except ValueError:
-            rel_path = root_path.replace("\\", "/")
-    else:
-        rel_path = root_path.replace("\\", "/")
+        return None
     
-    # Cek apakah ada pattern yang match
-    for pattern in just_set:
-        if not pattern:
-            continue
-        
-        pattern_norm = pattern.replace("\\", "/")
-        
-        # Exact match
-        if pattern_norm == rel_path:
-            return True
-        
-        # Substring match (untuk folder parent)
-        if pattern_norm in rel_path or rel_path in pattern_norm:
-            return True
-        
-        # Basename match (backward compatibility)
-        if pattern == os.path.basename(root_path):
-            return True
-        
-        # **NEW:** Jika pattern adalah filename (tidak ada / atau \), 
-        # keep directory untuk scan nested files
-        if "/" not in pattern and "\\" not in pattern:
-            # Pattern adalah filename, bukan path
-            # Keep directory agar bisa scan files di dalamnya
-            return True
-    
-    return False
+    # Pattern filename (bukan path): keep directory untuk scan files di dalamnya
+    if any("/" not in pattern and "\\" not in pattern for pattern in just_set):
+        return None
 
+    normalized = sorted({pattern.replace("\\", "/") for pattern in just_set})
+    pattern_re = re.compile("|".join(re.escape(pattern) for pattern in normalized))
+    # rel_path tidak pernah berisi newline, jadi "rel_path in joined" == substring salah satu pattern
+    joined = "\n".join(normalized)
+    names = frozenset(just_set)
 
-def combine_files_in_folder_recursive(
-    folder_path: str, output_file_name: str = "Output.txt", exclude_file: str | None = None, formatted_output: bool = True
-) -> None:
-    output_path = Path(output_file_name)
-    if output_path.exists():
-        try:
-            output_path.unlink()
-        except Exception:
-            log(f"[!] Error: Gagal menghapus file output '{output_path}'. Tutup file jika sedang dibuka.")
-            return
+    def keep(rel_path: str, dir_name: str) -> bool:
+        return (
+            rel_path in joined  # Substring match (untuk folder parent)
+            or dir_name in names  # Basename match (backward compatibility)
+            or pattern_re.search(rel_path) is not None  # Exact/substring match
+        )
 
-    if not os.path.isdir(folder_path):
-        log(f"[!] Error: Folder '{folder_path}' tidak ditemukan atau bukan direktori.")
-        return
+    return keep
 
-    exclude_set = set(read_exclude_file(exclude_file) if exclude_file else [])
-    just_me_path = config_data.get("JUST_ME_FILE_PATH")
-    just_set = set(read_list_file(just_me_path) if just_me_path else [])
 
-    # Simpan base folder untuk relative path calculation
-    base_folder = os.path.abspath(folder_path)
+class TextBundler:
+    """
+    State satu run TextEXtractor: filter, file output, dan statistik.
 
-    header_note = "BA denotes the top border and WA denotes the bottom border used to separate files.\n"
+    process_directory() memproses satu direktori hasil traversal dan
+    mengembalikan subdirektori yang masih perlu ditelusuri. Dengan begitu
+    traversal bisa dijalankan oleh caller lain (mis. CombinedExtractor yang
+    sekaligus mengumpulkan daftar nama) tanpa walk kedua.
+    """
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # List untuk track extracted files
-    extracted_files: list[str] = []
-    
-    # Progress tracking
-    file_count = 0
-    total_size = 0
-    skipped_count = 0
-    
-    # Summary info
-    log(f"[*] Memulai scanning folder: {folder_path}")
-    if just_set:
-        log(f"[*] Filter: Hanya {len(just_set)} file/folder → {just_set}")
-    else:
-        log(f"[*] Filter: ALL FILES (exclude {len(exclude_set)} patterns)")
-    log(f"[*] Max file size: {MAX_FILE_BYTES / 1024 / 1024:.1f} MB")
-    
-    with output_path.open("w", encoding="utf-8", errors="ignore") as out:
-        if formatted_output:
-            out.write(header_note)
-
-        for root, dirs, files in os.walk(folder_path):
-            pruned_dirs: list[str] = []
-            for directory in list(dirs):
-                full_path = os.path.join(root, directory)
-                
-                # Cek exclude dengan base folder
-                if is_excluded(root, directory, exclude_set, base_folder):
-                    continue
+    def __init__(
+        self,
+        folder_path: str,
+        output_path: Path,
+        exclude_file: str | None = None,
+        formatted_output: bool = True,
+        config: dict | None = None,
+        cache_contents: bool = False,
+    ) -> None:
+        self.folder_path = folder_path
+        self.output_path = output_path
+        self.formatted_output = formatted_output
+
+        # config: snapshot terbaru dari caller in-process; default config saat import
+        config = config_data if config is None else config
+        self.max_file_bytes = config.get("MAX_FILE_SIZE_MB", 10) * 1024 * 1024
+        # READ_WORKERS > 1: file dibaca di thread pool (tumpang tindih latensi I/O, berguna
+        # untuk HDD/drive jaringan), output tetap ditulis berurutan oleh thread utama
+        self.read_workers = max(1, int(config.get("READ_WORKERS", 1)))
+
+        self.exclude_set = read_patterns(exclude_file)
+        just_me_path = config.get("JUST_ME_FILE_PATH")
+        self.just_set = read_patterns(just_me_path)
+
+        # Semua token digabung menjadi satu regex per list
+        self.exclude_re = compile_tokens(self.exclude_set)
+        self.just_re = compile_tokens(self.just_set)
+        self.keep_dir = make_dir_keeper(self.just_set)
+
+        # Simpan base folder untuk relative path calculation
+        self.base_folder = os.path.abspath(folder_path)
+
+        # List untuk track extracted files
+        self.extracted_files: list[str] = []
+
+        # Progress tracking
+        self.file_count = 0
+        self.total_size = 0
+        self.skipped_count = 0
+
+        self._out = None
+        # cache_contents: pakai content_cache (hanya jalur baca serial)
+        self._cache = content_cache if cache_contents and content_cache.max_bytes > 0 else None
+        # Read-ahead: (file_path, size, prefix, suffix, future) dalam urutan traversal
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: deque[tuple[str, int, bytes, bytes, Future]] = deque()
+        self._pending_bytes = 0
+
+    def __enter__(self) -> "TextBundler":
+        header_note = "BA denotes the top border and WA denotes the bottom border used to separate files.\n"
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Summary info
+        log(f"[*] Memulai scanning folder: {self.folder_path}")
+        if self.just_set:
+            log(f"[*] Filter: Hanya {len(self.just_set)} file/folder → {self.just_set}")
+        else:
+            log(f"[*] Filter: ALL FILES (exclude {len(self.exclude_set)} patterns)")
+        log(f"[*] Max file size: {self.max_file_bytes / 1024 / 1024:.1f} MB")
+
+        # Output ditulis sebagai bytes dengan buffer 1 MiB; satu writelines per file
+        self._out = self.output_path.open("wb", buffering=OUTPUT_BUFFER_BYTES)
+        if self.formatted_output:
+            self._out.write(header_note.encode("utf-8"))
+        if self.read_workers > 1:
+            self._pool = ThreadPoolExecutor(max_workers=self.read_workers, thread_name_prefix="reader")
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if self._pool is not None:
+            if exc_type is None:
+                while self._pending:
+                    self._write_next()
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._pending.clear()
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+    def _record_file(self, file_path: str, size: int) -> None:
+        self.file_count += 1
+        self.total_size += size
+        
+        # Track extracted file
+        self.extracted_files.append(file_path)
+        
+        # Progress log setiap 100 files
+        if self.file_count % 100 == 0:
+            log(f"[+] Diproses: {self.file_count} files ({self.total_size / 1024 / 1024:.1f} MB)")
+
+    def _queue_read(self, file_path: str, size: int, prefix: bytes, suffix: bytes) -> None:
+        """Kirim file ke reader thread; tulis hasil terlama jika read-ahead penuh."""
+        self._pending.append((file_path, size, prefix, suffix, self._pool.submit(read_source, file_path)))
+        self._pending_bytes += size
+        while len(self._pending) > READ_AHEAD_FILES or self._pending_bytes > READ_AHEAD_BYTES:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        """Tulis file terlama di antrean read-ahead (urutan output = urutan traversal)."""
+        file_path, size, prefix, suffix, future = self._pending.popleft()
+        self._pending_bytes -= size
+        try:
+            content = future.result()
+        except Exception as exc:
+            log(f"[!] Melewatkan file '{file_path}' karena kesalahan: {exc}")
+            self.skipped_count += 1
+            return
+        if content is None:
+            self.skipped_count += 1
+            return
+        self._out.writelines((prefix, content, suffix))
+        self._record_file(file_path, size)
+
+    def process_directory(
+        self, root: str, dirs: list[os.DirEntry], files: list[os.DirEntry]
+    ) -> list[os.DirEntry]:
+        """Gabungkan file di satu direktori; return subdirektori yang lolos filter."""
+        exclude_re = self.exclude_re
+        just_re = self.just_re
+        keep_dir = self.keep_dir
+        formatted_output = self.formatted_output
+        # Alias lokal: global/atribut modul dibaca sekali per direktori, bukan per file
+        excluded = is_excluded
+        sniff_binary = looks_binary
+        whitelist_suffixes = WHITELIST_SUFFIXES
+        max_file_bytes = self.max_file_bytes
+        mmap_min_bytes = MMAP_MIN_BYTES
+        mmap_file = mmap.mmap
+        mmap_read = mmap.ACCESS_READ
+        write_parts = self._out.writelines
+        record_file = self._record_file
+        pool = self._pool
+        cache = self._cache
+
+        # Relative path direktori dihitung sekali; path child cukup prefix + nama
+        rel_root = os.path.relpath(root, self.base_folder).replace("\\", "/")
+        rel_prefix = "" if rel_root == "." else rel_root + "/"
+
+        pruned_dirs: list[os.DirEntry] = []
+        for directory in dirs:
+            dir_rel = rel_prefix + directory.name
+
+            # Cek exclude dengan base folder
+            if excluded(dir_rel, exclude_re):
+                continue
+            
+            # Cek just_me dengan base folder
+            if keep_dir is not None and not keep_dir(dir_rel, directory.name):
+                continue
                 
-                # Cek just_me dengan base folder
-                if not dir_should_keep(full_path, just_set, exclude_set, base_folder):
-                    continue
-                    
-                pruned_dirs.append(directory)
-            dirs[:] = pruned_dirs
+            pruned_dirs.append(directory)
 
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                
+        # fd direktori dibuka sekali; setiap open file cukup relatif ke fd ini
+        dir_fd: int | None = None
+        if USE_DIR_FD and files and pool is None:
+            try:
+                dir_fd = os.open(root, os.O_RDONLY)
+            except OSError:
+                dir_fd = None  # jatuh ke open dengan path lengkap
+
+        def dir_opener(name: str, flags: int) -> int:
+            return os.open(name, flags, dir_fd=dir_fd)
+
+        try:
+            for entry in files:
+                filename = entry.name
+                file_path = entry.path
+                rel_path = rel_prefix + filename
+            
                 # Cek exclude dengan base folder
-                if is_excluded(root, filename, exclude_set, base_folder):
-                    skipped_count += 1
+                if excluded(rel_path, exclude_re):
+                    self.skipped_count += 1
                     continue
 
-                # Cek just_me dengan path lengkap
-                if just_set:
-                    file_path = os.path.join(root, filename)
-                    try:
-                        rel_path = os.path.relpath(file_path, base_folder).replace("\\", "/")
-                    except ValueError:
-                        rel_path = file_path.replace("\\", "/")
-                    
-                    # Cek apakah file match dengan pattern di just_set
-                    matched = False
-                    for pattern in just_set:
-                        if not pattern:
-                            continue
-                        pattern_norm = pattern.replace("\\", "/")
-                        
-                        # Exact match
-                        if pattern_norm == rel_path:
-                            matched = True
-                            break
-                        
-                        # Substring match
-                        if pattern_norm in rel_path:
-                            matched = True
-                            break
-                        
-                        # Filename match (backward compatibility)
-                        if pattern == filename:
-                            matched = True
-                            break
-                    
-                    if not matched:
-                        skipped_count += 1
-                        continue
-
-                ext = os.path.splitext(filename)[1].lower()
-                if WHITELIST_EXT is not None and ext and ext not in WHITELIST_EXT:
-                    skipped_count += 1
+                # Cek just_me dengan path lengkap (exact, substring, atau nama file)
+                if just_re is not None and just_re.search(rel_path) is None:
+                    self.skipped_count += 1
                     continue
 
-                file_path = os.path.join(root, filename)
+                # Satu endswith(tuple) di level C; file tanpa ekstensi (termasuk dotfile
+                # seperti .bashrc, setara os.path.splitext) tetap diproses
+                if (
+                    whitelist_suffixes is not None
+                    and not filename.lower().endswith(whitelist_suffixes)
+                    and "." in filename.lstrip(".")
+                ):
+                    self.skipped_count += 1
+                    continue
 
                 try:
-                    size = os.path.getsize(file_path)
+                    stat = entry.stat()
+                    size = stat.st_size
                 except Exception:
-                    skipped_count += 1
+                    self.skipped_count += 1
                     continue
 
-                if size > MAX_FILE_BYTES:
-                    skipped_count += 1
+                if size > max_file_bytes:
+                    self.skipped_count += 1
                     continue
 
                 try:
-                    with open(file_path, "rb") as binary_file:
-                        sample = binary_file.read(4096)
-                        if looks_binary(sample):
-                            skipped_count += 1
-                            continue
+                    if formatted_output:
+                        prefix = f"BA\n'{file_path}'\n".encode("utf-8", "ignore")
+                        suffix = b"\nWA\n"
+                    else:
+                        prefix = f"----- {file_path} -----\n".encode("utf-8", "ignore")
+                        suffix = b"\n\n"
 
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-                        content = handle.read()
+                    if pool is not None:
+                        self._queue_read(file_path, size, prefix, suffix)
+                        continue
 
-                    if formatted_output:
-                        out.write("BA\n")
-                        out.write(f"'{file_path}'\n")
-                        out.write(content)
-                        out.write("\nWA\n")
+                    # File kecil yang tidak berubah sejak run sebelumnya: pakai isi dari cache
+                    signature = None
+                    if cache is not None and size < mmap_min_bytes:
+                        signature = (stat.st_mtime_ns, size)
+                        cached = cache.get(file_path, signature)
+                        if cached is not None:
+                            write_parts((prefix, cached, suffix))
+                            record_file(file_path, size)
+                            continue
+
+                    # Satu open tanpa buffer Python; isi diteruskan ke output tanpa decode/encode ulang
+                    if dir_fd is not None:
+                        binary_file = open(filename, "rb", buffering=0, opener=dir_opener)
                     else:
-                        out.write(f"----- {file_path} -----\n")
-                        out.write(content)
-                        out.write("\n\n")
-                    
-                    file_count += 1
-                    total_size += size
-                    
-                    # Track extracted file
-                    extracted_files.append(file_path)
-                    
-                    # Progress log setiap 100 files
-                    if file_count % 100 == 0:
-                        log(f"[+] Diproses: {file_count} files ({total_size / 1024 / 1024:.1f} MB)")
-                    
+                        binary_file = open(file_path, "rb", buffering=0)
+                    with binary_file:
+                        if size >= mmap_min_bytes:
+                            # File besar: mmap page cache langsung, tanpa salinan bytes di heap
+                            with mmap_file(binary_file.fileno(), 0, access=mmap_read) as mapped:
+                                if sniff_binary(mapped[:4096]):
+                                    self.skipped_count += 1
+                                    continue
+                                write_parts((prefix, mapped, suffix))
+                        else:
+                            # File kecil: satu read() ke satu bytes, 4096 byte pertama untuk sniff
+                            content = binary_file.read()
+                            if sniff_binary(content[:4096]):
+                                self.skipped_count += 1
+                                continue
+                            write_parts((prefix, content, suffix))
+                            if signature is not None:
+                                cache.put(file_path, signature, content)
+                
+                    record_file(file_path, size)
+                
                 except Exception as exc:
                     log(f"[!] Melewatkan file '{file_path}' karena kesalahan: {exc}")
-                    skipped_count += 1
-
-    # Save extracted files list to project directory
-    project_output_dir = ROOT_DIR / "data" / "output"
-    project_output_dir.mkdir(parents=True, exist_ok=True)
-    extracted_list_path = project_output_dir / "OutputExtractedFiles.txt"
-    
-    try:
-        with extracted_list_path.open("w", encoding="utf-8") as f:
-            # Write target folder as root
-            f.write(f"{base_folder}; [FOLDER]\n")
-            
-            # Write all extracted files
-            for file_path in extracted_files:
+                    self.skipped_count += 1
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        return pruned_dirs
+
+    def finish(self) -> None:
+        """Simpan OutputExtractedFiles.txt dan tulis ringkasan ke log."""
+        # Save extracted files list to project directory
+        extracted_list_path = EXTRACTED_LIST_FILE
+        extracted_list_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            # Target folder sebagai root, lalu semua file yang diekstrak;
+            # baris dikumpulkan di list lalu satu join + satu write
+            lines = [f"{self.base_folder}; [FOLDER]\n"]
+            for file_path in self.extracted_files:
                 # Normalize path separators
                 normalized_path = file_path.replace("\\", "/")
-                f.write(f"{normalized_path}; [FILE]\n")
-        
-        log(f"-> File list saved: '{extracted_list_path}'")
-    except Exception as exc:
-        log(f"[!] Warning: Gagal menyimpan file list: {exc}")
+                lines.append(f"{normalized_path}; [FILE]\n")
+            with extracted_list_path.open("w", encoding="utf-8") as f:
+                f.write("".join(lines))
+            
+            log(f"-> File list saved: '{extracted_list_path}'")
+        except Exception as exc:
+            log(f"[!] Warning: Gagal menyimpan file list: {exc}")
+
+        log(f"\n-> Berhasil! {self.file_count} files digabungkan ({self.total_size / 1024 / 1024:.1f} MB)")
+        log(f"-> Skipped: {self.skipped_count} files (binary/too large/errors)")
+        log(f"-> Output: '{self.output_path}'.")
+
+
+def prepare_output(folder_path: str, output_path: Path) -> bool:
+    """Hapus output lama dan validasi folder; False jika run harus dibatalkan."""
+    if output_path.exists():
+        try:
+            output_path.unlink()
+        except Exception:
+            log(f"[!] Error: Gagal menghapus file output '{output_path}'. Tutup file jika sedang dibuka.")
+            return False
+
+    if not os.path.isdir(folder_path):
+        log(f"[!] Error: Folder '{folder_path}' tidak ditemukan atau bukan direktori.")
+        return False
 
-    log(f"\n-> Berhasil! {file_count} files digabungkan ({total_size / 1024 / 1024:.1f} MB)")
-    log(f"-> Skipped: {skipped_count} files (binary/too large/errors)")
-    log(f"-> Output: '{output_path}'.")
+    return True
 
 
-def main() -> None:
-    folder = clean_path(os.environ.get("VT_FOLDER") or config_data.get("TARGET_FOLDER") or "")
+def combine_files_in_folder_recursive(
+    folder_path: str,
+    output_file_name: str = "Output.txt",
+    exclude_file: str | None = None,
+    formatted_output: bool = True,
+    config: dict | None = None,
+    cache_contents: bool = False,
+) -> None:
+    output_path = Path(output_file_name)
+    if not prepare_output(folder_path, output_path):
+        return
+
+    bundler = TextBundler(folder_path, output_path, exclude_file, formatted_output, config, cache_contents)
+    with bundler:
+        for root, dirs, files in iter_tree(folder_path):
+            dirs[:] = bundler.process_directory(root, dirs, files)
+    bundler.finish()
+
+
+def main(config: dict | None = None, folder_override: str | None = None, cache_contents: bool = False) -> None:
+    """
+    Entry point CLI dan in-process.
+
+    Route Flask memanggil main(get_config(), path, cache_contents=True)
+    langsung (tanpa spawn interpreter baru); CLI memakai config saat import
+    dan env VT_FOLDER.
+    """
+    config = config_data if config is None else config
+    folder = clean_path(folder_override or os.environ.get("VT_FOLDER") or config.get("TARGET_FOLDER") or "")
     if not folder:
         log("[!] TARGET_FOLDER belum diset di config.json")
         return
 
-    output_file = config_data.get("OUTPUT_FILE") or str(Path("Output.txt"))
+    output_file = config.get("OUTPUT_FILE") or str(Path("Output.txt"))
     combine_files_in_folder_recursive(
         folder_path=folder,
         output_file_name=output_file,
-        exclude_file=config_data.get("EXCLUDE_FILE_PATH"),
+        exclude_file=config.get("EXCLUDE_FILE_PATH"),
         formatted_output=True,
+        config=config,
+        cache_contents=cache_contents,
     )
 
 
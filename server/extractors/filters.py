@@ -0,0 +1,161 @@
+# filters.py
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+try:
+    import re2  # google-re2: DFA linear-time, cepat untuk alternation token yang panjang
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Token dengan karakter ini diperlakukan sebagai glob; "[" sengaja tidak
+# dipakai sebagai pemicu agar nama folder seperti "[id]" tetap dicocokkan literal
+GLOB_CHARS = ("*", "?")
+
+# Byte "teks" (tab..CR dan ASCII printable); sisanya dihitung non-text oleh looks_binary
+_TEXT_BYTES = bytes(range(9, 14)) + bytes(range(32, 127))
+
+
+def read_patterns(file_path: str | None) -> frozenset[str]:
+    """
+    Baca file exclude/just_me menjadi frozenset pattern.
+
+    Set dibangun sekali per run dan tidak pernah diubah, jadi dibuat immutable.
+    Baris kosong dan komentar (#) dilewati. File yang tidak ada atau tidak
+    bisa dibaca menghasilkan set kosong.
+    """
+    if not file_path:
+        return frozenset()
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
+            text = handle.read()
+    except OSError:
+        return frozenset()
+    return frozenset(
+        stripped for line in text.splitlines() if (stripped := line.strip()) and not stripped.startswith("#")
+    )
+
+
+def _translate_glob(body: str) -> str:
+    """
+    Terjemahkan isi glob ke regex dengan semantik .gitignore: "*" dan "?" tidak
+    melewati "/", "**" melewati direktori ("**/" = nol atau lebih direktori),
+    "[...]" adalah kelas karakter (tanpa "/").
+    """
+    parts: list[str] = []
+    index = 0
+    length = len(body)
+    while index < length:
+        char = body[index]
+        if char == "*":
+            if body.startswith("**", index):
+                index += 2
+                if body.startswith("/", index):
+                    parts.append("(?:.*/)?")
+                    index += 1
+                else:
+                    parts.append(".*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            start = index + 1
+            if start < length and body[start] == "!":
+                start += 1
+            if start < length and body[start] == "]":
+                start += 1
+            end = body.find("]", start)
+            if end == -1:
+                parts.append("\\[")
+            else:
+                content = body[index + 1:end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = "^/" + content[1:]
+                elif content.startswith("^"):
+                    content = "\\" + content
+                parts.append(f"[{content}]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def glob_to_regex(token: str) -> str:
+    """
+    Terjemahkan token glob ke regex gaya .gitignore untuk path relatif.
+
+    - Default: cocok mulai dari awal salah satu komponen path ("*.log").
+    - Diawali "/": di-anchor ke root folder target ("/dist/*"), seperti .gitignore.
+    - Diakhiri "/": hanya direktori, cocok dengan direktori itu sendiri dan
+      semua isinya ("*.egg-info/").
+    - "*" dan "?" tidak melewati "/" ("src/*.py" tidak cocok dengan
+      "src/a/b.py"); pakai "**" untuk melewati direktori ("src/**/*.py").
+    """
+    anchored = token.startswith("/")
+    dir_only = token.endswith("/")
+    core = _translate_glob(token.strip("/"))
+    prefix = "^" if anchored else "(?:^|/)"
+    suffix = "(?:/|\\Z)" if dir_only else "\\Z"
+    return prefix + core + suffix
+
+
+def compile_tokens(tokens: Iterable[str]) -> Optional[re.Pattern[str]]:
+    """
+    Gabungkan token exclude/just_me menjadi satu regex alternation.
+
+    Satu pattern.search(path) menggantikan loop `token in path` per token,
+    sehingga biaya per entry tidak lagi tumbuh linear dengan jumlah token.
+    Token dinormalisasi ke separator "/" seperti path yang dicocokkan.
+    Token yang mengandung * atau ? adalah glob (lihat glob_to_regex) yang harus
+    cocok dengan akhir path, mulai dari awal salah satu komponen: "*.log",
+    "build/*", "*Controller.js"; "*" tidak melewati "/" (pakai "**"), "/" di
+    awal meng-anchor ke root dan "/" di akhir berarti direktori beserta
+    isinya. Token lain tetap substring literal.
+    Jika google-re2 terpasang dan tidak ada glob, pattern dikompilasi dengan
+    RE2 (objek dengan API search() yang sama).
+    Return None jika tidak ada token (caller memperlakukannya sebagai "tidak ada filter").
+
+    Hasil compile di-cache per set token: run in-process berikutnya dengan
+    isi exclude/just_me yang sama memakai ulang pattern yang sudah dikompilasi.
+    """
+    return _compile_token_set(frozenset(token.replace("\\", "/") for token in tokens if token))
+
+
+@lru_cache(maxsize=32)
+def _compile_token_set(token_set: frozenset[str]) -> Optional[re.Pattern[str]]:
+    normalized = sorted(token_set)
+    if not normalized:
+        return None
+    globs = [token for token in normalized if any(char in token for char in GLOB_CHARS)]
+    literals = [token for token in normalized if token not in globs] if globs else normalized
+    if RE2_AVAILABLE and not globs:
+        try:
+            return re2.compile("|".join(re2.escape(token) for token in literals))
+        except Exception:
+            pass  # pattern yang ditolak RE2 jatuh ke modul re bawaan
+    # Regex glob memakai \Z (sintaks modul re), jadi glob selalu lewat re
+    parts = [re.escape(token) for token in literals]
+    parts.extend(glob_to_regex(token) for token in globs)
+    return re.compile("|".join(parts))
+
+
+def looks_binary(sample: bytes) -> bool:
+    """
+    Heuristik file binary dari sampel awal file (biasanya 4096 byte pertama).
+
+    Binary jika ada byte NUL (dicari dengan memchr) atau lebih dari 30% byte
+    bukan teks. bytes.translate(None, _TEXT_BYTES) menghapus semua byte teks
+    dalam satu pass C, jadi panjang sisanya = jumlah byte non-text tanpa loop
+    Python per byte.
+    """
+    if not sample:
+        return False
+    if b"\x00" in sample:
+        return True
+    non_text = len(sample.translate(None, _TEXT_BYTES))
+    return non_text > len(sample) * 0.30
@@ -0,0 +1,223 @@
+# traversal.py
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, Optional
+
+WalkItem = tuple[str, list[os.DirEntry], list[os.DirEntry]]
+
+
+def _scan_dir(path: str) -> Optional[tuple[list[os.DirEntry], list[os.DirEntry]]]:
+    """Baca satu direktori; None jika tidak bisa dibuka (diabaikan seperti os.walk)."""
+    dirs: list[os.DirEntry] = []
+    files: list[os.DirEntry] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return None
+    return dirs, files
+
+
+def _subdir_paths(dirs: list[os.DirEntry]) -> list[str]:
+    """Path subdirektori yang akan ditelusuri (symlink tidak diikuti)."""
+    paths: list[str] = []
+    for entry in dirs:
+        try:
+            if entry.is_symlink():
+                continue
+        except OSError:
+            continue
+        paths.append(entry.path)
+    return paths
+
+
+def _prefetch_stats(files: list[os.DirEntry]) -> None:
+    """Isi cache stat() DirEntry; error dibiarkan muncul lagi saat caller memanggil stat()."""
+    for entry in files:
+        try:
+            entry.stat()
+        except OSError:
+            pass
+
+
+def iter_tree(top: str) -> Iterator[WalkItem]:
+    """
+    Pengganti os.walk berbasis os.scandir dengan stack eksplisit.
+
+    Menghasilkan (root, dirs, files) top-down seperti os.walk, tetapi isi
+    dirs/files adalah DirEntry sehingga caller bisa memakai entry.path,
+    entry.name dan entry.stat() tanpa os.path.join atau stat ulang.
+    Caller boleh memangkas dirs secara in-place (dirs[:] = ...) untuk
+    melewati subtree, sama seperti os.walk. Symlink ke direktori tetap
+    muncul di dirs tetapi tidak ditelusuri (perilaku followlinks=False).
+    """
+    stack = [top]
+    while stack:
+        root = stack.pop()
+        scanned = _scan_dir(root)
+        if scanned is None:
+            continue
+        dirs, files = scanned
+
+        yield root, dirs, files
+
+        # Push terbalik agar urutan kunjungan sama dengan os.walk
+        stack.extend(reversed(_subdir_paths(dirs)))
+
+
+def parallel_walk(
+    top: str,
+    workers: int = 8,
+    keep_dir: Optional[Callable[[str, os.DirEntry], bool]] = None,
+    stat_files: bool = False,
+) -> Iterator[WalkItem]:
+    """
+    Versi iter_tree yang menjalankan os.scandir di banyak thread sekaligus.
+
+    Berguna untuk drive jaringan (SMB/NFS) di mana setiap scandir menunggu
+    round-trip server. Worker mengambil direktori dari antrean LIFO bersama,
+    membaca isinya, lalu mendorong subdirektori kembali ke antrean; counter
+    direktori yang belum selesai menandai kapan pekerjaan habis.
+
+    Hasil tetap di-yield dalam urutan os.walk sehingga output deterministik.
+    Karena scandir berjalan mendahului caller, pemangkasan in-place pada dirs
+    tidak berlaku di sini; gunakan keep_dir(root, entry) untuk menyaring
+    subdirektori sebelum masuk antrean. workers <= 1 memakai iter_tree biasa.
+
+    stat_files=True: worker juga memanggil stat() untuk setiap file. Hasilnya
+    di-cache di DirEntry, jadi entry.stat() di caller tidak lagi memicu
+    syscall, dan stat banyak direktori berjalan bersamaan mendahului caller.
+    """
+    if workers <= 1:
+        for root, dirs, files in iter_tree(top):
+            if keep_dir is not None:
+                dirs[:] = [d for d in dirs if keep_dir(root, d)]
+            yield root, dirs, files
+        return
+
+    pending: deque[str] = deque([top])
+    results: dict[str, Optional[tuple[list[os.DirEntry], list[os.DirEntry]]]] = {}
+    cond = threading.Condition()
+    state = {"outstanding": 1, "stop": False}
+
+    def worker() -> None:
+        while True:
+            with cond:
+                while not pending and state["outstanding"] and not state["stop"]:
+                    cond.wait()
+                if state["stop"] or not pending:
+                    return
+                path = pending.pop()
+
+            scanned = None
+            subdirs: list[str] = []
+            try:
+                listing = _scan_dir(path)
+                if listing is not None:
+                    dirs, files = listing
+                    if keep_dir is not None:
+                        dirs = [d for d in dirs if keep_dir(path, d)]
+                    if stat_files:
+                        _prefetch_stats(files)
+                    subdirs = _subdir_paths(dirs)
+                    scanned = (dirs, files)
+            except Exception:
+                # Direktori bermasalah dilewati; consumer tidak boleh menunggu selamanya
+                scanned, subdirs = None, []
+
+            with cond:
+                results[path] = scanned
+                pending.extend(reversed(subdirs))
+                state["outstanding"] += len(subdirs) - 1
+                cond.notify_all()
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scandir")
+    try:
+        for _ in range(workers):
+            executor.submit(worker)
+
+        stack = [top]
+        while stack:
+            root = stack.pop()
+            with cond:
+                while root not in results:
+                    cond.wait()
+                scanned = results.pop(root)
+            if scanned is None:
+                continue
+            dirs, files = scanned
+            yield root, dirs, files
+            stack.extend(reversed(_subdir_paths(dirs)))
+    finally:
+        with cond:
+            state["stop"] = True
+            pending.clear()
+            cond.notify_all()
+        executor.shutdown(wait=True)
+
+
+def _scan_folder_level(path: str) -> tuple[int, list[str]]:
+    """Satu scandir: total ukuran file langsung dan path subdirektori (tanpa symlink)."""
+    level_size = 0
+    subdirs: list[str] = []
+    push = subdirs.append
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    # is_symlink/is_file/is_dir memakai d_type dari readdir;
+                    # hanya stat() untuk ukuran yang butuh syscall (gratis di Windows)
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_file(follow_symlinks=False):
+                        level_size += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        push(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return level_size, subdirs
+
+
+def folder_size(folder_path: str, workers: int = 1) -> int:
+    """
+    Total ukuran file dalam subtree (symlink tidak dihitung dan tidak diikuti).
+
+    workers > 1: setiap direktori di-scan di thread pool sehingga stat() dari
+    banyak direktori berjalan bersamaan (syscall melepas GIL).
+    """
+    total_size = 0
+    if workers <= 1:
+        stack = [folder_path]
+        # Alias lokal: lookup atribut tidak diulang per direktori
+        scan = _scan_folder_level
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            level_size, subdirs = scan(pop())
+            total_size += level_size
+            extend(subdirs)
+        return total_size
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="foldersize") as executor:
+        pending = {executor.submit(_scan_folder_level, folder_path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                level_size, subdirs = future.result()
+                total_size += level_size
+                pending.update(executor.submit(_scan_folder_level, path) for path in subdirs)
+    return total_size
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import TclError, filedialog, Tk
 
 from flask import Blueprint, jsonify, render_template, request
@@ -9,13 +12,26 @@ from server.config import (
     clean_path,
     get_config,
     is_allowed_path,
-    save_config,
+    set_config_value,
 )
 from server.services.gitignore_sync import sync_gitignore_to_exclude
 
 config_bp = Blueprint("config_routes", __name__)
 
 
+def _scan_top_level(path: str) -> dict[str, bool] | None:
+    """
+    Satu os.scandir pada folder target: memvalidasi folder ada dan bisa
+    dibaca, sekaligus memberi entry top-level (nama -> is_file dari d_type,
+    tanpa stat per entry). Return None jika bukan folder yang bisa dibaca.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry.is_file() for entry in it}
+    except OSError:
+        return None
+
+
 @config_bp.route("/")
 def index():
     return render_template("Tree.html")
@@ -27,17 +43,16 @@ def set_project_path():
         payload = request.get_json(silent=True) or {}
         new_path = clean_path(payload.get("path", "")).strip()
 
-        if not new_path or not os.path.isdir(new_path):
+        top_entries = _scan_top_level(new_path) if new_path else None
+        if top_entries is None:
             return jsonify({"success": False, "error": "Path tidak valid atau tidak ditemukan."}), 400
         if not is_allowed_path(new_path):
             return jsonify({"success": False, "error": "Path tersebut tidak diizinkan."}), 403
 
-        config = get_config()
-        config["TARGET_FOLDER"] = new_path
-        save_config(config)
+        config = set_config_value("TARGET_FOLDER", new_path)
 
         exclude_path = config.get("EXCLUDE_FILE_PATH", "")
-        if sync_gitignore_to_exclude(new_path, exclude_path):
+        if sync_gitignore_to_exclude(new_path, exclude_path, has_gitignore=top_entries.get(".gitignore", False)):
             message = "Path berhasil diatur dan pola .gitignore digabungkan."
         else:
             message = "Path berhasil diatur dan disimpan ke config.json."
@@ -47,15 +62,50 @@ def set_project_path():
         return jsonify({"success": False, "error": str(exc)}), 500
 
 
+# Tk tidak thread-safe: root dibuat sekali dan semua dialog dijalankan di satu
+# thread khusus ini, sehingga request berikutnya tidak membayar bootstrap Tcl/Tk lagi
+_tk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tk-dialog")
+_tk_root: Tk | None = None
+
+
+def _ask_directory(title: str, initial_dir: str) -> str:
+    """Dijalankan di thread _tk_executor; root hidden dibuat saat dialog pertama."""
+    global _tk_root
+    if _tk_root is None:
+        root = Tk()
+        root.withdraw()
+        root.attributes("-topmost", True)
+        _tk_root = root
+    chosen = filedialog.askdirectory(parent=_tk_root, initialdir=initial_dir, title=title)
+    _tk_root.update()  # Proses event tersisa agar jendela dialog benar-benar tertutup
+    return clean_path(chosen)
+
+
 def _open_folder_dialog(title: str, initial_dir: str) -> str:
-    root = Tk()
-    root.withdraw()
-    root.attributes("-topmost", True)
-    try:
-        chosen = filedialog.askdirectory(initialdir=initial_dir, title=title)
-        return clean_path(chosen)
-    finally:
-        root.destroy()
+    return _tk_executor.submit(_ask_directory, title, initial_dir).result()
+
+
+def _destroy_tk_root() -> None:
+    """Dijalankan di thread _tk_executor: Tk harus dihancurkan di thread pembuatnya."""
+    global _tk_root
+    if _tk_root is not None:
+        _tk_root.destroy()
+        _tk_root = None
+
+
+def _shutdown_tk() -> None:
+    """Teardown saat interpreter berhenti: destroy root Tk lalu matikan executor."""
+    if _tk_root is not None:
+        try:
+            _tk_executor.submit(_destroy_tk_root).result(timeout=5)
+        except Exception:
+            pass  # Tk yang sudah rusak tidak boleh menggagalkan shutdown
+    _tk_executor.shutdown(wait=False)
+
+
+# Hook threading dijalankan sebelum concurrent.futures menutup executor-nya
+# (atexit biasa sudah terlambat: executor tidak lagi menerima pekerjaan)
+getattr(threading, "_register_atexit", atexit.register)(_shutdown_tk)
 
 
 @config_bp.route("/pick_folder", methods=["GET"])
@@ -70,8 +120,7 @@ def pick_folder():
         if not is_allowed_path(chosen):
             return jsonify({"success": False, "error": "Path tersebut tidak diizinkan."}), 403
 
-        config["TARGET_FOLDER"] = chosen
-        save_config(config)
+        config = set_config_value("TARGET_FOLDER", chosen)
 
         exclude_path = config.get("EXCLUDE_FILE_PATH", "")
         if sync_gitignore_to_exclude(chosen, exclude_path):
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Lock
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, send_file
 
-from server.config import clean_path, get_config
+from server.config import clean_path, get_config, write_text_atomic
 
 lists_bp = Blueprint("lists", __name__)
 
+# Isi file list per path, berlaku selama (mtime_ns, size) file sama
+_list_cache: dict[str, tuple[tuple[int, int], str]] = {}
+# Serialisasi write + stat + update cache agar entri cache cocok dengan isi file
+_list_write_lock = Lock()
+
 
 def _normalize_content(raw: str) -> str:
     lines = (line.rstrip() for line in raw.splitlines())
@@ -21,6 +27,48 @@ def _ensure_file(path: Path) -> None:
         path.touch()
 
 
+def _read_list_file(path: Path, signature: tuple[int, int]) -> str:
+    """Baca isi file list; hanya open+read ulang jika mtime/ukuran berubah sejak dibaca."""
+    key = str(path)
+    cached = _list_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    content = path.read_text(encoding="utf-8", errors="ignore")
+    _list_cache[key] = (signature, content)
+    return content
+
+
+def _list_file_response(path: Path) -> Response:
+    """
+    Response GET untuk file list dengan ETag lemah dari (mtime_ns, size).
+
+    Jika If-None-Match browser masih cocok, balas 304 tanpa membaca file
+    (cukup satu stat); Cache-Control no-cache memaksa browser selalu revalidasi.
+    """
+    _ensure_file(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({"success": True, "content": _read_list_file(path, signature)})
+    response.set_etag(etag, weak=True)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _write_list_file(path: Path, content: str) -> None:
+    """Tulis file list dan perbarui cache agar GET berikutnya tidak membaca ulang."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _list_write_lock:
+        write_text_atomic(path, content)
+        stat = path.stat()
+        _list_cache[str(path)] = ((stat.st_mtime_ns, stat.st_size), content)
+
+
 @lists_bp.route("/manage_exclude_file", methods=["GET", "POST"])
 def manage_exclude_file():
     try:
@@ -32,9 +80,7 @@ def manage_exclude_file():
         file_path = Path(clean_path(exclude_path))
 
         if request.method == "GET":
-            _ensure_file(file_path)
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            return jsonify({"success": True, "content": content})
+            return _list_file_response(file_path)
 
         data = request.get_json(silent=True) or {}
         new_content = data.get("content", "")
@@ -42,14 +88,35 @@ def manage_exclude_file():
         if len(new_content) > 200_000:
             return jsonify({"success": False, "error": "Konten terlalu besar."}), 400
 
-        normalized = _normalize_content(new_content)
-        _ensure_file(file_path)
-        file_path.write_text(normalized, encoding="utf-8")
+        _write_list_file(file_path, _normalize_content(new_content))
         return jsonify({"success": True, "message": "Daftar pengecualian berhasil disimpan."})
     except Exception as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
 
 
+@lists_bp.route("/exclude_file/raw", methods=["GET"])
+def exclude_file_raw():
+    """
+    Isi exclude file apa adanya (text/plain) untuk tab Exclude Me.
+
+    Tanpa decode + escape JSON; send_file memberi ETag/Last-Modified dan
+    menjawab revalidasi browser dengan 304 selama file tidak berubah.
+    """
+    try:
+        exclude_path = get_config().get("EXCLUDE_FILE_PATH")
+        if not exclude_path:
+            return jsonify({"success": False, "error": "EXCLUDE_FILE_PATH tidak diset di config.json"}), 500
+
+        file_path = Path(clean_path(exclude_path))
+        _ensure_file(file_path)
+        response = send_file(file_path.resolve(), mimetype="text/plain", conditional=True)
+        response.cache_control.no_cache = True
+        response.cache_control.must_revalidate = True
+        return response
+    except Exception as exc:
+        return jsonify({"success": False, "error": str(exc)}), 500
+
+
 @lists_bp.route("/manage_just_me", methods=["GET", "POST"])
 def manage_just_me():
     try:
@@ -61,9 +128,7 @@ def manage_just_me():
         file_path = Path(clean_path(just_me_path))
 
         if request.method == "GET":
-            _ensure_file(file_path)
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            return jsonify({"success": True, "content": content})
+            return _list_file_response(file_path)
 
         data = request.get_json(silent=True) or {}
         new_content = data.get("content", "")
@@ -71,9 +136,7 @@ def manage_just_me():
         if len(new_content) > 200_000:
             return jsonify({"success": False, "error": "Konten terlalu besar."}), 400
 
-        normalized = _normalize_content(new_content)
-        _ensure_file(file_path)
-        file_path.write_text(normalized, encoding="utf-8")
+        _write_list_file(file_path, _normalize_content(new_content))
         return jsonify({"success": True, "message": "Daftar just_me berhasil disimpan."})
     except Exception as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
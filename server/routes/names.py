@@ -1,52 +1,40 @@
 from __future__ import annotations
 
-import json
 import os
-import subprocess
-import sys
-from pathlib import Path
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, send_file
 
-from server.config import SERVER_DIR, clean_path, get_config, is_allowed_path
-from server.services.metrics import compute_size, human_readable_size
+from server.config import clean_path, get_config, is_allowed_path
+from server.extractors.NamesExtractor import iter_names_json, run_names_file, run_names_text
+from server.services.metrics import compute_size, human_readable_size, stat_etag
 
 names_bp = Blueprint("names", __name__)
 
-NAMES_EXTRACTOR_SCRIPT = Path(SERVER_DIR / "extractors" / "NamesExtractor.py")
+
+def _flag(value) -> bool:
+    """Parse flag payload seperti argparse CLI NamesExtractor (`"true"` / True)."""
+    return str(value).lower() == "true"
 
 
 @names_bp.route("/run_nameextractor", methods=["POST"])
 def run_nameextractor_legacy():
     try:
         payload = request.get_json(silent=True) or {}
-        include_files = payload.get("include_files", True)
-        include_size = payload.get("include_size", False)
-
-        subprocess.run(
-            [
-                sys.executable,
-                str(NAMES_EXTRACTOR_SCRIPT),
-                "--include-files",
-                str(include_files),
-                "--include-size",
-                str(include_size),
-                "--format",
-                "text",
-            ],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-        )
+        include_files = _flag(payload.get("include_files", True))
+        include_size = _flag(payload.get("include_size", False))
+
+        # Client yang meminta text/plain menerima file output apa adanya (di-stream
+        # lewat wsgi.file_wrapper), tanpa envelope JSON dan tanpa memuat isinya ke RAM
+        if request.accept_mimetypes.best_match(["application/json", "text/plain"]) == "text/plain":
+            output_path = run_names_file(get_config(), include_files, include_size)
+            return send_file(output_path, mimetype="text/plain", max_age=0)
 
-        config = get_config()
-        output_path = Path(config.get("NAME_OUTPUT_FILE"))
-        content = output_path.read_text(encoding="utf-8", errors="ignore")
+        # In-process: tanpa spawn interpreter baru dan tanpa membaca ulang NAME_OUTPUT_FILE
+        content = run_names_text(get_config(), include_files, include_size)
         return jsonify({"success": True, "output": content})
-    except subprocess.CalledProcessError as exc:
-        return jsonify({"success": False, "error": exc.stderr}), 500
     except Exception as exc:
+        if request.accept_mimetypes.best_match(["application/json", "text/plain"]) == "text/plain":
+            return Response(str(exc), status=500, mimetype="text/plain")
         return jsonify({"success": False, "error": str(exc)}), 500
 
 
@@ -54,40 +42,25 @@ def run_nameextractor_legacy():
 def run_nameextractor_json():
     try:
         payload = request.get_json(silent=True) or {}
-        include_files = payload.get("include_files", True)
-        include_size = payload.get("include_size", False)
+        include_files = _flag(payload.get("include_files", True))
+        include_size = _flag(payload.get("include_size", False))
         override_path = payload.get("path")
 
-        env = os.environ.copy()
-        if override_path:
-            env["VT_FOLDER"] = clean_path(override_path)
-
-        process = subprocess.run(
-            [
-                sys.executable,
-                str(NAMES_EXTRACTOR_SCRIPT),
-                "--include-files",
-                str(include_files),
-                "--include-size",
-                str(include_size),
-                "--format",
-                "json",
-            ],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-            timeout=600,
-            env=env,
-        )
-        items = json.loads(process.stdout or "[]")
-        return jsonify({"success": True, "items": items})
-    except subprocess.TimeoutExpired:
-        return jsonify({"success": False, "error": "Proses terlalu lama dan dihentikan."}), 504
-    except subprocess.CalledProcessError as exc:
-        return jsonify({"success": False, "error": exc.stderr}), 500
-    except json.JSONDecodeError:
-        return jsonify({"success": False, "error": "Output JSON tidak valid dari NamesExtractor."}), 500
+        # In-process: array JSON di-stream langsung dari generator NamesExtractor,
+        # tanpa spawn interpreter baru dan tanpa membaca pipe stdout
+        chunks = iter_names_json(get_config(), include_files, include_size, override_path)
+
+        # Chunk pertama diambil sebelum response dimulai, agar kegagalan awal
+        # (mis. TARGET_FOLDER kosong) masih dilaporkan dengan status HTTP yang benar
+        first_chunk = next(chunks)
+
+        def generate():
+            yield b'{"success":true,"items":'
+            yield first_chunk
+            yield from chunks
+            yield b"}"
+
+        return Response(generate(), mimetype="application/json")
     except Exception as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
 
@@ -99,8 +72,19 @@ def size_endpoint():
         return jsonify({"success": False, "error": "Path tidak ditemukan."}), 400
     if not is_allowed_path(path):
         return jsonify({"success": False, "error": "Path tidak diizinkan."}), 403
-    size_bytes = compute_size(path)
-    return jsonify(
-        {"success": True, "size_bytes": size_bytes, "formatted_size": human_readable_size(size_bytes)}
-    )
+
+    # ETag dari signature yang sama dengan cache compute_size (mtime_ns file/direktori):
+    # revalidasi polling UI dijawab 304 tanpa menghitung ulang
+    etag = stat_etag(path)
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        size_bytes = compute_size(path)
+        response = jsonify(
+            {"success": True, "size_bytes": size_bytes, "formatted_size": human_readable_size(size_bytes)}
+        )
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.cache_control.no_cache = True
+    return response
 
@@ -4,11 +4,13 @@ Task Routes untuk Async Processing
 
 from __future__ import annotations
 
+import os
 import threading
 import time
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, send_file
 
 from server.config import clean_path, get_config
+from server.services.cleaners import remove_blank_lines_inplace
 from server.services.task_manager import task_manager, TaskInfo
 from server.extractors.EnhancedTextExtractor import enhanced_combine_files_in_folder_recursive
 
@@ -39,18 +41,40 @@ def run_text_extraction_task(task_info: TaskInfo):
             task_info=task_info
         )
         
-        if result["success"]:
-            task_info.complete({
-                "result": result,
-                "message": f"Successfully processed {result['stats']['processed_files']} files"
-            })
-        else:
+        # Extractor hanya melaporkan progress; task baru ditandai selesai di sini,
+        # setelah post-processing, agar client tidak mengambil output setengah jadi
+        if not result["success"]:
             task_info.fail(f"Extraction failed: {result['error']}")
-            
+            return
+
+        processed_files = result["stats"]["processed_files"]
+        if task_info.params.get("remove_blank_lines"):
+            task_info.update_progress(99, "Removing blank lines...", processed_files=processed_files)
+            cleaned, info = remove_blank_lines_inplace(output_file)
+            if not cleaned:
+                task_info.fail(f"Removing blank lines failed: {info}")
+                return
+
+        # Progress 100 dan current_file kosong: poller tidak melihat task selesai sebagai macet
+        task_info.update_progress(100, "", processed_files=processed_files)
+        task_info.complete({
+            "result": result,
+            "message": f"Successfully processed {processed_files} files"
+        })
     except Exception as exc:
         task_info.fail(f"Task failed with exception: {str(exc)}")
 
 
+def start_text_extraction_task(task_info: TaskInfo) -> None:
+    """Jalankan run_text_extraction_task di background thread; request langsung kembali."""
+    thread = threading.Thread(
+        target=run_text_extraction_task,
+        args=(task_info,),
+        daemon=True
+    )
+    thread.start()
+
+
 @task_bp.route("/start_extraction", methods=["POST"])
 def start_extraction():
     """Start async text extraction task"""
@@ -79,12 +103,7 @@ def start_extraction():
         )
         
         # Start background task
-        thread = threading.Thread(
-            target=run_text_extraction_task,
-            args=(task_info,),
-            daemon=True
-        )
-        thread.start()
+        start_text_extraction_task(task_info)
         
         return jsonify({
             "success": True,
@@ -245,3 +264,43 @@ def get_task_result(task_id):
             "success": False,
             "error": str(exc)
         }), 500
+
+
+@task_bp.route("/task_output/<task_id>", methods=["GET"])
+def get_task_output(task_id):
+    """
+    Kirim file output task yang sudah selesai sebagai text/plain.
+
+    send_file memakai wsgi.file_wrapper (sendfile di server yang mendukung),
+    jadi isi file tidak dimuat ke memori Python dan tidak di-escape ke JSON;
+    conditional=True menjawab If-Modified-Since/Range dari browser.
+    """
+    try:
+        task_info = task_manager.get_task(task_id)
+        if not task_info:
+            return jsonify({
+                "success": False,
+                "error": "Task not found"
+            }), 404
+
+        if task_info.status != "completed":
+            return jsonify({
+                "success": False,
+                "error": f"Task not completed yet, status: {task_info.status}"
+            }), 400
+
+        # Path relatif ditulis relatif ke cwd proses, bukan ke root_path Flask
+        output_file = os.path.abspath(task_info.params.get("output_file", "Output.txt"))
+        if not os.path.isfile(output_file):
+            return jsonify({
+                "success": False,
+                "error": "File output tidak ditemukan."
+            }), 404
+
+        return send_file(output_file, mimetype="text/plain", conditional=True, max_age=0)
+
+    except Exception as exc:
+        return jsonify({
+            "success": False,
+            "error": str(exc)
+        }), 500
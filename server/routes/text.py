@@ -1,29 +1,29 @@
 from __future__ import annotations
 
 import os
-import subprocess
-import sys
+from itertools import chain
 from pathlib import Path
+from stat import S_ISDIR
 from typing import Tuple
 
 from flask import Blueprint, Response, jsonify, request
+from werkzeug.wsgi import ClosingIterator, wrap_file
 
 from server.config import (
+    EXTRACTED_LIST_FILE,
     OUTPUT_DIR,
-    ROOT_DIR,
-    SERVER_DIR,
     clean_path,
     get_config,
-    save_config,
+    set_config_value,
 )
+from server.extractors.TextEXtractor import capture_log, main as run_text_extractor
+from server.routes.task_routes import start_text_extraction_task
 from server.services.cleaners import remove_blank_lines_inplace
-from server.services.metrics import summarize_output_file
+from server.services.metrics import stat_etag, summarize_output_file
 from server.services.task_manager import task_manager
 
 text_bp = Blueprint("text", __name__)
 
-TEXT_EXTRACTOR_SCRIPT = Path(SERVER_DIR / "extractors" / "TextEXtractor.py")
-
 
 def _needs_output_destination(cfg: dict, override_dir: str | None = None, override_name: str | None = None) -> Tuple[bool, str, str]:
     if override_dir or override_name:
@@ -37,15 +37,13 @@ def _needs_output_destination(cfg: dict, override_dir: str | None = None, overri
     out_dir = out_path.parent
     if out_dir == Path("."):
         out_dir = OUTPUT_DIR
-    if not out_dir.exists():
+    # Satu stat untuk "ada" + "folder", lalu os.access (tanpa membuat/menghapus file probe)
+    try:
+        is_dir = S_ISDIR(os.stat(out_dir).st_mode)
+    except OSError:
         return True, f"Folder output belum ada: {out_dir}", out_path.name or "Output.txt"
 
-    try:
-        out_dir.mkdir(parents=True, exist_ok=True)
-        probe = out_dir / ".cd_probe_write"
-        probe.write_text("ok", encoding="utf-8")
-        probe.unlink()
-    except Exception:
+    if not is_dir or not os.access(out_dir, os.W_OK | os.X_OK):
         return True, f"Folder output tidak dapat ditulis: {out_dir}", out_path.name or "Output.txt"
 
     return False, "", ""
@@ -75,10 +73,6 @@ def run_extractor():
                 428,
             )
 
-        env = os.environ.copy()
-        if override_path:
-            env["VT_FOLDER"] = clean_path(override_path)
-
         original_output_file = config.get("OUTPUT_FILE")
         if output_dir or output_name:
             base_name = output_name or (Path(original_output_file).name if original_output_file else "Output.txt")
@@ -91,19 +85,14 @@ def run_extractor():
 
             new_output_full = base_dir / base_name
             new_output_full.parent.mkdir(parents=True, exist_ok=True)
-            config["OUTPUT_FILE"] = str(new_output_full)
-            save_config(config)
-
-        # Increased timeout from 30 min to 2 hours for large projects
-        process = subprocess.run(
-            [sys.executable, str(TEXT_EXTRACTOR_SCRIPT)],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=True,
-            timeout=7200,  # 2 hours instead of 30 minutes
-            env=env,
-        )
+            config = set_config_value("OUTPUT_FILE", str(new_output_full))
+
+        # Dijalankan in-process (tanpa spawn interpreter baru); log extractor
+        # ditampung dan dikirim di awal response seperti stdout/stderr subprocess dulu.
+        # File yang tidak berubah sejak run sebelumnya diambil dari cache isi file.
+        with capture_log() as extractor_log:
+            run_text_extractor(config, clean_path(override_path) if override_path else None, cache_contents=True)
+        extractor_output = extractor_log.getvalue()
 
         out_path = Path(config.get("OUTPUT_FILE") or (OUTPUT_DIR / "Output.txt"))
 
@@ -117,28 +106,21 @@ def run_extractor():
                 header_notes.append(f"Blank-line cleaner gagal: {info}")
         
         # Add info about OutputExtractedFiles.txt
-        extracted_list_path = ROOT_DIR / "data" / "output" / "OutputExtractedFiles.txt"
-        if extracted_list_path.exists():
-            header_notes.append(f"📋 File list disimpan: {extracted_list_path}")
-
-        def generate():
-            header = "\n".join(part for part in [process.stdout, process.stderr] if part).strip()
-            note_text = "\n".join(header_notes).strip()
-            prelude_parts = [text for text in [header, note_text] if text]
-            if prelude_parts:
-                yield ("\n".join(prelude_parts)).strip() + "\n\n"
-
-            # PERFORMANCE: Increased chunk size to 128KB for much better I/O efficiency
-            # This reduces syscalls and speeds up large file processing significantly
-            with out_path.open("r", encoding="utf-8", errors="ignore") as handle:
-                for chunk in iter(lambda: handle.read(131072), ""):  # 128KB chunks (was 16KB)
-                    yield chunk
-
-        return Response(generate(), mimetype="text/plain; charset=utf-8")
-    except subprocess.TimeoutExpired:
-        return jsonify({"success": False, "error": "TextEXtractor berjalan terlalu lama."}), 504
-    except subprocess.CalledProcessError as exc:
-        return jsonify({"success": False, "error": exc.stderr}), 500
+        if EXTRACTED_LIST_FILE.exists():
+            header_notes.append(f"📋 File list disimpan: {EXTRACTED_LIST_FILE}")
+
+        header = extractor_output.strip()
+        note_text = "\n".join(header_notes).strip()
+        prelude_parts = [text for text in [header, note_text] if text]
+        prelude = ("\n".join(prelude_parts)).strip() + "\n\n" if prelude_parts else ""
+
+        # PERFORMANCE: file output dikirim sebagai bytes apa adanya lewat wsgi.file_wrapper
+        # (128KB per blok), tanpa decode/encode per chunk. Tanpa prelude, server WSGI bisa
+        # memakai sendfile langsung; dengan prelude, blok file dirangkai setelah header.
+        body = wrap_file(request.environ, out_path.open("rb"), buffer_size=131072)
+        if prelude:
+            body = ClosingIterator(chain([prelude.encode("utf-8")], body), body.close)
+        return Response(body, mimetype="text/plain", direct_passthrough=True)
     except FileNotFoundError:
         return jsonify({"success": False, "error": "File output tidak ditemukan."}), 500
     except Exception as exc:
@@ -186,8 +168,7 @@ def run_extractor_async():
 
             new_output_full = base_dir / base_name
             new_output_full.parent.mkdir(parents=True, exist_ok=True)
-            config["OUTPUT_FILE"] = str(new_output_full)
-            save_config(config)
+            config = set_config_value("OUTPUT_FILE", str(new_output_full))
         else:
             new_output_full = Path(config.get("OUTPUT_FILE") or (OUTPUT_DIR / "Output.txt"))
 
@@ -201,13 +182,16 @@ def run_extractor_async():
                 "remove_blank_lines": remove_blank
             }
         )
+        # Task harus benar-benar dijalankan; tanpa ini status tetap "pending" selamanya
+        start_text_extraction_task(task_info)
 
+        # task_bp didaftarkan dengan url_prefix="/tasks"
         return jsonify({
             "success": True,
             "task_id": task_info.task_id,
             "message": "Async text extraction started",
-            "status_endpoint": f"/task_status/{task_info.task_id}",
-            "result_endpoint": f"/task_result/{task_info.task_id}"
+            "status_endpoint": f"/tasks/task_status/{task_info.task_id}",
+            "result_endpoint": f"/tasks/task_result/{task_info.task_id}"
         })
 
     except Exception as exc:
@@ -222,9 +206,20 @@ def output_metrics():
     try:
         config = get_config()
         output_path = config.get("OUTPUT_FILE") or str(OUTPUT_DIR / "Output.txt")
-        metrics = summarize_output_file(output_path)
-        metrics.update({"success": True})
-        return jsonify(metrics)
+
+        # UI mem-polling endpoint ini: selama file output tidak berubah, cukup
+        # satu stat dan balas 304 tanpa body
+        etag = stat_etag(output_path)
+        if etag is not None and request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            metrics = summarize_output_file(output_path)
+            metrics.update({"success": True})
+            response = jsonify(metrics)
+        if etag is not None:
+            response.set_etag(etag, weak=True)
+            response.cache_control.no_cache = True
+        return response
     except Exception as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
 
@@ -233,18 +228,25 @@ def output_metrics():
 def open_output_folder():
     """Open the data/output folder in file explorer"""
     try:
-        output_dir = ROOT_DIR / "data" / "output"
+        output_dir = OUTPUT_DIR
         output_dir.mkdir(parents=True, exist_ok=True)
         
         import platform
         import subprocess
+        import threading
         
         if platform.system() == "Windows":
-            subprocess.run(["explorer", str(output_dir)])
+            command = ["explorer", str(output_dir)]
         elif platform.system() == "Darwin":  # macOS
-            subprocess.run(["open", str(output_dir)])
+            command = ["open", str(output_dir)]
         else:  # Linux
-            subprocess.run(["xdg-open", str(output_dir)])
+            command = ["xdg-open", str(output_dir)]
+
+        # Popen tanpa menunggu: file manager (terutama xdg-open) bisa tetap
+        # berjalan lama, dan request ini tidak perlu menahan worker thread.
+        # Proses anak di-reap di daemon thread agar tidak tersisa sebagai zombie.
+        process = subprocess.Popen(command, start_new_session=True)
+        threading.Thread(target=process.wait, daemon=True).start()
         
         return jsonify({
             "success": True,
@@ -1,17 +1,46 @@
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Tuple
 
+STREAM_BUFFER_BYTES = 1024 * 1024
+
 
 def remove_blank_lines_inplace(file_path: str) -> Tuple[bool, int | str]:
-    """Remove blank or whitespace-only lines from a file in-place."""
+    """
+    Remove blank or whitespace-only lines from a file in-place.
+
+    File di-stream baris per baris ke file sementara di folder yang sama lalu
+    di-os.replace: memori O(baris terpanjang) alih-alih O(ukuran file), dan
+    file asli tetap utuh jika proses gagal di tengah jalan.
+    """
     path = Path(file_path)
+    tmp_name = None
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines(keepends=True)
-        cleaned = [line for line in lines if line.strip()]
-        path.write_text("".join(cleaned), encoding="utf-8", errors="ignore")
-        return True, len(lines) - len(cleaned)
+        removed = 0
+        # newline="": baris dipecah di \n, \r\n dan \r tanpa mengubah akhir baris saat dibaca
+        with path.open("r", encoding="utf-8", errors="ignore", newline="", buffering=STREAM_BUFFER_BYTES) as source, \
+                tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", errors="ignore", newline="", dir=path.parent, prefix=f".{path.name}.",
+                    suffix=".tmp", delete=False, buffering=STREAM_BUFFER_BYTES,
+                ) as target:
+            tmp_name = target.name
+            write = target.write
+            for line in source:
+                if line.strip():
+                    write(line)
+                else:
+                    removed += 1
+        # NamedTemporaryFile dibuat 0600; pertahankan permission file output asli
+        os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        os.replace(tmp_name, path)
+        return True, removed
     except Exception as exc:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
         return False, str(exc)
-
@@ -2,41 +2,55 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import Iterator
+
 from server.config import clean_path
 
+# Section .gitignore di exclude file; dikompilasi sekali saat import
+_GITIGNORE_SECTION_RE = re.compile(r"(# === POLA DARI \.gitignore ===[\s\S]*?)(?=\n\n|\Z)")
+
 
-def _read_patterns(path: Path) -> list[str]:
+def _iter_patterns(path: Path) -> Iterator[str]:
+    """Pola non-kosong dan bukan komentar, di-stream per baris (strip sekali per baris)."""
     if not path.exists():
-        return []
+        return
     with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        return [
-            line.strip()
-            for line in handle
-            if line.strip() and not line.lstrip().startswith("#")
-        ]
+        for line in handle:
+            pattern = line.strip()
+            if pattern and not pattern.startswith("#"):
+                yield pattern
+
 
+def sync_gitignore_to_exclude(
+    target_folder: str, exclude_file_path: str, has_gitignore: bool | None = None
+) -> bool:
+    """
+    Gabungkan pola .gitignore target_folder ke exclude file.
 
-def sync_gitignore_to_exclude(target_folder: str, exclude_file_path: str) -> bool:
-    if not target_folder or not exclude_file_path:
+    has_gitignore: hasil scan folder yang sudah dilakukan caller; jika None,
+    keberadaan .gitignore dicek sendiri dengan stat.
+    """
+    if not target_folder or not exclude_file_path or has_gitignore is False:
         return False
 
     gitignore_path = Path(clean_path(target_folder)) / ".gitignore"
-    if not gitignore_path.exists():
+    if has_gitignore is None and not gitignore_path.exists():
         return False
 
     try:
-        gitignore_lines = _read_patterns(gitignore_path)
-
         exclude_path = Path(clean_path(exclude_file_path))
-        existing_lines = _read_patterns(exclude_path)
+        # Pola exclude langsung di-stream ke set, tanpa list perantara
+        existing = set(_iter_patterns(exclude_path))
 
-        combined = set(existing_lines)
-        new_patterns = [pattern for pattern in gitignore_lines if pattern not in combined]
+        # dict.fromkeys: dedup .gitignore dengan urutan asli tetap terjaga
+        # (selisih set akan mengacak urutan pola di exclude file)
+        new_patterns = [
+            pattern for pattern in dict.fromkeys(_iter_patterns(gitignore_path))
+            if pattern not in existing
+        ]
         if not new_patterns:
             return True
 
-        combined.update(new_patterns)
-
         header = (
             "\n\n# === POLA DARI .gitignore ===\n"
             "# Pola di bawah ini otomatis disinkronkan saat Set Path.\n"
@@ -48,14 +62,13 @@ def sync_gitignore_to_exclude(target_folder: str, exclude_file_path: str) -> boo
 
         new_section = header + "\n".join(new_patterns) + "\n"
 
-        if "# === POLA DARI .gitignore ===" in old_content:
-            pattern = re.compile(r"(# === POLA DARI \.gitignore ===[\s\S]*?)(?=\n\n|\Z)")
-            if pattern.search(old_content):
-                final_content = pattern.sub(new_section.rstrip() + "\n", old_content).strip() + "\n"
-            else:
-                final_content = (old_content.rstrip() + new_section).strip() + "\n"
-        else:
-            final_content = (old_content.rstrip() + new_section).strip() + "\n"
+        # Satu pass: subn mengganti section lama sekaligus memberi tahu apakah section ada.
+        # Replacement lewat fungsi agar backslash di pola (mis. `src\build`) tidak diartikan escape regex.
+        replacement = new_section.rstrip() + "\n"
+        final_content, replaced = _GITIGNORE_SECTION_RE.subn(lambda _match: replacement, old_content)
+        if not replaced:
+            final_content = old_content.rstrip() + new_section
+        final_content = final_content.strip() + "\n"
 
         exclude_path.parent.mkdir(parents=True, exist_ok=True)
         exclude_path.write_text(final_content, encoding="utf-8")
@@ -1,11 +1,37 @@
 from __future__ import annotations
 
 import math
+import mmap
 import os
 import re
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from stat import S_ISDIR
+from typing import Dict, List
+
+from server.extractors.traversal import folder_size
+
+# Satu "kata" = deretan karakter non-whitespace; dikompilasi sekali saat import
+_WORDS_RE = re.compile(r"\S+")
+
+# Teks besar dipecah per ~1M karakter agar tokenizer (Rust) bisa berjalan paralel
+TOKEN_CHUNK_CHARS = 1024 * 1024
+
+# Hasil summarize_output_file per path, berlaku selama (mtime_ns, size) file sama (LRU)
+SUMMARY_CACHE_ENTRIES = 64
+_summary_cache: "OrderedDict[str, tuple[tuple[int, int], Dict[str, int | bool]]]" = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+# Total ukuran direktori per path, berlaku selama mtime_ns direktori itu sama (LRU)
+SIZE_CACHE_ENTRIES = 4096
+_size_cache: "OrderedDict[str, tuple[int, int]]" = OrderedDict()
+_size_cache_lock = threading.Lock()
+
+# Thread scandir paralel untuk cache miss compute_size (1 = serial); stat() melepas GIL,
+# jadi banyak direktori bisa di-scan bersamaan (terasa di SSD dingin, Windows, drive jaringan)
+SIZE_SCAN_WORKERS = max(1, int(os.environ.get("CD_SIZE_WORKERS", "8")))
 
 
 def human_readable_size(num_bytes: int) -> str:
@@ -18,42 +44,146 @@ def human_readable_size(num_bytes: int) -> str:
     return f"{size:.1f} {units[idx]}"
 
 
-@lru_cache(maxsize=500)
+def stat_etag(path: str) -> str | None:
+    """
+    ETag (lemah) dari (mtime_ns, size) path, atau None jika path tidak bisa di-stat.
+
+    Memakai signature yang sama dengan cache summarize_output_file/compute_size,
+    jadi ETag berubah tepat saat hasil cache-nya dihitung ulang.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
 def compute_size(path: str) -> int:
     """
     Compute total size of a file or directory.
-    
-    PERFORMANCE: Cached with LRU (max 500 entries) for 90% faster repeated access.
-    Cache is automatically evicted when full.
-    
+
+    PERFORMANCE: File cukup satu os.stat. Direktori dijumlahkan dengan
+    traversal.folder_size (os.scandir + DirEntry, SIZE_SCAN_WORKERS thread) dan hasilnya di-cache
+    (LRU, max SIZE_CACHE_ENTRIES) selama mtime_ns direktori itu tidak berubah.
+    mtime root hanya berubah saat entry langsung ditambah/dihapus/di-rename,
+    jadi ini proxy kesegaran yang lemah untuk perubahan jauh di dalam subtree.
+
     Args:
         path: Path to file or directory
-        
+
     Returns:
         Total size in bytes
     """
-    target = Path(path)
-    if target.is_file():
-        try:
-            return target.stat().st_size
-        except OSError:
-            return 0
-
-    total = 0
-    for root, _, files in os.walk(target, followlinks=False):
-        for name in files:
-            file_path = Path(root) / name
-            try:
-                if not file_path.is_symlink():
-                    total += file_path.stat().st_size
-            except OSError:
-                continue
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0
+    if not S_ISDIR(stat.st_mode):
+        return stat.st_size
+
+    key = os.path.abspath(path)
+    with _size_cache_lock:
+        cached = _size_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns:
+            _size_cache.move_to_end(key)
+            return cached[1]
+
+    total = folder_size(path, SIZE_SCAN_WORKERS)
+
+    with _size_cache_lock:
+        _size_cache[key] = (stat.st_mtime_ns, total)
+        _size_cache.move_to_end(key)
+        while len(_size_cache) > SIZE_CACHE_ENTRIES:
+            _size_cache.popitem(last=False)
     return total
 
 
+@lru_cache(maxsize=8)
+def get_encoder_for_model(model: str):
+    """
+    Encoder tiktoken untuk model, dibuat sekali per nama model.
+
+    Fallback ke cl100k_base jika model tidak dikenal. Return None jika
+    tiktoken tidak terpasang atau file BPE tidak bisa dimuat (hasil ini ikut
+    di-cache agar tidak mencoba download ulang di setiap request).
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            return None
+
+
+def split_for_tokenizer(text: str, chunk_chars: int = TOKEN_CHUNK_CHARS) -> List[str]:
+    """
+    Pecah teks menjadi potongan ~chunk_chars untuk encode batch.
+
+    Potongan hanya diakhiri tepat setelah "\n" yang diikuti huruf atau angka.
+    Di cl100k_base maupun o200k_base tidak ada pre-token yang melintasi titik
+    itu (pola huruf/angka tidak boleh diawali \r atau \n, dan pola tanda baca
+    hanya menyerap [\r\n/] di belakangnya), sehingga jumlah token semua
+    potongan sama dengan encode sekali. Batas setelah "\n" sebelum karakter
+    lain (mis. "}\n// komentar") tidak aman: o200k menggabungkan "\n/".
+    """
+    chunks: List[str] = []
+    start = 0
+    length = len(text)
+    while length - start > chunk_chars:
+        cut = text.find("\n", start + chunk_chars)
+        while cut != -1 and cut + 1 < length and not text[cut + 1].isalnum():
+            cut = text.find("\n", cut + 1)
+        if cut == -1 or cut + 1 >= length:
+            break
+        chunks.append(text[start:cut + 1])
+        start = cut + 1
+    chunks.append(text[start:])
+    return chunks
+
+
+def _read_output_text(file_path: Path, size: int) -> tuple[str, int]:
+    """
+    Decode file output langsung dari mmap dan hitung panjang UTF-8-nya.
+
+    Hasil sama dengan read_text(errors="ignore") + len(text.encode()), tetapi
+    tanpa salinan bytes penuh di heap: teks di-decode dari halaman mmap, dan
+    untuk file UTF-8 valid tanpa "\r" jumlah byte = ukuran file (tanpa encode ulang).
+    """
+    if size == 0:
+        return "", 0
+    with file_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        has_cr = mm.find(b"\r") != -1
+        try:
+            text = str(mm, "utf-8")
+            lossless = True
+        except UnicodeDecodeError:
+            text = str(mm, "utf-8", "ignore")
+            lossless = False
+        mapped_size = len(mm)
+    if has_cr:
+        # Samakan dengan universal newline read_text
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if lossless and not has_cr:
+        return text, mapped_size
+    return text, len(text.encode("utf-8"))
+
+
 def summarize_output_file(path: str) -> Dict[str, int | bool]:
+    """
+    Hitung words/tokens/lines/chars/bytes file output.
+
+    Tokenisasi adalah biaya terbesar, jadi hasilnya di-cache per path dan
+    hanya dihitung ulang jika mtime atau ukuran file berubah.
+    """
     file_path = Path(path)
-    if not file_path.exists():
+    try:
+        stat = file_path.stat()
+    except OSError:
         return {
             "exists": False,
             "words": 0,
@@ -63,25 +193,31 @@ def summarize_output_file(path: str) -> Dict[str, int | bool]:
             "bytes": 0,
         }
 
-    text = file_path.read_text(encoding="utf-8", errors="ignore")
-    words = len(re.findall(r"\S+", text))
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            _summary_cache.move_to_end(path)
+            return dict(cached[1])  # Salinan: caller boleh menambah key (mis. "success")
+
+    text, bytes_len = _read_output_text(file_path, stat.st_size)
+    # finditer + hitung: tanpa membangun list berisi jutaan string kata
+    words = sum(1 for _ in _WORDS_RE.finditer(text))
     lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
     chars = len(text)
-    bytes_len = len(text.encode("utf-8"))
-
-    tokens = 0
-    try:
-        import tiktoken
 
+    tokens = math.ceil(chars / 4) if chars else 0  # Estimasi jika tiktoken tidak tersedia
+    encoder = get_encoder_for_model("gpt-4o-mini")
+    if encoder is not None:
         try:
-            encoder = tiktoken.encoding_for_model("gpt-4o-mini")
+            # encode_ordinary_batch: potongan di-tokenize paralel di thread Rust (GIL dilepas);
+            # "ordinary" = teks seperti <|endoftext|> dihitung biasa, bukan error special token
+            batches = encoder.encode_ordinary_batch(split_for_tokenizer(text), num_threads=os.cpu_count() or 1)
+            tokens = sum(len(batch) for batch in batches)
         except Exception:
-            encoder = tiktoken.get_encoding("cl100k_base")
-        tokens = len(encoder.encode(text))
-    except Exception:
-        tokens = math.ceil(chars / 4) if chars else 0
+            pass
 
-    return {
+    summary: Dict[str, int | bool] = {
         "exists": True,
         "words": words,
         "tokens": tokens,
@@ -89,4 +225,10 @@ def summarize_output_file(path: str) -> Dict[str, int | bool]:
         "chars": chars,
         "bytes": bytes_len,
     }
+    with _summary_cache_lock:
+        _summary_cache[path] = (signature, summary)
+        _summary_cache.move_to_end(path)
+        while len(_summary_cache) > SUMMARY_CACHE_ENTRIES:
+            _summary_cache.popitem(last=False)
+    return dict(summary)
 
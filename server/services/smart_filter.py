@@ -12,39 +12,60 @@ from typing import Dict, List, Set, Tuple
 
 from server.services.memory_manager import memory_monitor
 
+# File type priorities (higher number = higher priority); dibangun sekali per modul
+FILE_PRIORITIES: Dict[str, int] = {
+    # Source code files - highest priority
+    ".py": 10, ".js": 10, ".ts": 10, ".tsx": 10, ".jsx": 10,
+    ".java": 9, ".kt": 9, ".go": 9, ".rs": 9, ".cpp": 9,
+    ".c": 8, ".h": 8, ".hpp": 8, ".cs": 8,
+
+    # Configuration files
+    ".json": 8, ".yaml": 8, ".yml": 8, ".toml": 8, ".ini": 8,
+    ".cfg": 8, ".conf": 8, ".config": 8,
+
+    # Documentation
+    ".md": 7, ".txt": 6, ".rst": 6,
+
+    # Web files
+    ".html": 7, ".css": 6, ".scss": 6, ".vue": 9,
+
+    # Scripts
+    ".sh": 7, ".bat": 7, ".ps1": 7,
+
+    # Database
+    ".sql": 7,
+
+    # Less important files
+    ".xml": 5, ".png": 1, ".jpg": 1, ".jpeg": 1, ".gif": 1,
+    ".ico": 1, ".svg": 2, ".pdf": 2, ".zip": 1, ".tar": 1,
+    ".gz": 1, ".log": 3, ".tmp": 1, ".cache": 1
+}
+
+
+def file_extension(path: str) -> str:
+    """
+    Ekstensi lowercase (".py"), sama dengan os.path.splitext(path)[1].lower().
+
+    Satu rfind dari kanan tanpa alokasi tuple; titik di awal nama file
+    (dotfile seperti .bashrc) bukan ekstensi.
+    """
+    dot = path.rfind(".")
+    if dot <= 0:
+        return ""
+    start = path.rfind(os.sep) + 1
+    if os.altsep:
+        start = max(start, path.rfind(os.altsep) + 1)
+    if dot < start or not path[start:dot].strip("."):
+        return ""
+    return path[dot:].lower()
+
 
 class SmartFileFilter:
     """Smart file filtering dan prioritization system"""
     
     def __init__(self):
         # File type priorities (higher number = higher priority)
-        self.file_priorities = {
-            # Source code files - highest priority
-            ".py": 10, ".js": 10, ".ts": 10, ".tsx": 10, ".jsx": 10,
-            ".java": 9, ".kt": 9, ".go": 9, ".rs": 9, ".cpp": 9,
-            ".c": 8, ".h": 8, ".hpp": 8, ".cs": 8,
-            
-            # Configuration files
-            ".json": 8, ".yaml": 8, ".yml": 8, ".toml": 8, ".ini": 8,
-            ".cfg": 8, ".conf": 8, ".config": 8,
-            
-            # Documentation
-            ".md": 7, ".txt": 6, ".rst": 6,
-            
-            # Web files
-            ".html": 7, ".css": 6, ".scss": 6, ".vue": 9,
-            
-            # Scripts
-            ".sh": 7, ".bat": 7, ".ps1": 7,
-            
-            # Database
-            ".sql": 7,
-            
-            # Less important files
-            ".xml": 5, ".png": 1, ".jpg": 1, ".jpeg": 1, ".gif": 1,
-            ".ico": 1, ".svg": 2, ".pdf": 2, ".zip": 1, ".tar": 1,
-            ".gz": 1, ".log": 3, ".tmp": 1, ".cache": 1
-        }
+        self.file_priorities = FILE_PRIORITIES
         
         # Large project thresholds
         self.thresholds = {
@@ -81,7 +102,7 @@ class SmartFileFilter:
                         total_size += file_size
                         
                         # Count file types
-                        ext = os.path.splitext(filename)[1].lower()
+                        ext = file_extension(filename)
                         file_type_counts[ext] = file_type_counts.get(ext, 0) + 1
                         
                         # Count large files (>10MB)
@@ -193,7 +214,7 @@ class SmartFileFilter:
         """Calculate file score based on priority and size"""
         try:
             # Get file extension priority
-            ext = os.path.splitext(file_path)[1].lower()
+            ext = file_extension(file_path)
             priority = self.file_priorities.get(ext, 3)  # Default priority 3
             
             # Get file size (smaller files get slight priority boost)
@@ -239,7 +260,7 @@ class SmartFileFilter:
                     return True, "Binary file skipped"
             
             # Check file extension priority
-            ext = os.path.splitext(file_path)[1].lower()
+            ext = file_extension(file_path)
             if ext not in self.file_priorities:
                 return True, f"Unsupported file type: {ext}"
             